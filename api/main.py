@@ -3,15 +3,25 @@ FastAPI backend for the Report Generator.
 Provides REST API endpoints for the web UI.
 """
 
+import asyncio
 import os
 import re
+import threading
+import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException
+import aiofiles
+import aiofiles.os
+import anyio.to_thread
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+import orjson
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 # Add parent directory to path for imports
@@ -28,12 +38,46 @@ from src.database import SettingsManager, RecipientsManager, ReportHistoryManage
 # Initialize database
 init_database()
 
+# Matches the address part of "Name <email>" recipients
+_EMAIL_RE = re.compile(r"<([^>]+)>")
+
+# Settings whose values are masked in /api/settings responses
+_SENSITIVE_KEYS = frozenset({"email_password", "slack_bot_token", "groq_api_key"})
+
+
+def extract_email(recipient: str) -> str:
+    """Extract the bare address from a 'Name <email>' recipient string."""
+    match = _EMAIL_RE.search(recipient)
+    return match.group(1) if match else recipient.strip()
+
+
+def format_date_range(reports: list[dict]) -> Optional[str]:
+    """Format the covered period of a list of {'date': datetime} dicts.
+
+    Finds the earliest and latest date in a single pass.
+    """
+    if not reports:
+        return None
+    it = iter(reports)
+    lo = hi = next(it)["date"]
+    for report in it:
+        d = report["date"]
+        if d < lo:
+            lo = d
+        elif d > hi:
+            hi = d
+    return f"{lo.strftime('%B %d')} to {hi.strftime('%B %d, %Y')}"
+
 app = FastAPI(
     title="Report Generator API",
     description="API for generating and sending weekly status reports",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+# Compress large JSON/text responses (reports and previews are text-heavy)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Enable CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -66,6 +110,7 @@ class SendEmailRequest(BaseModel):
     subject: Optional[str] = None
     to_emails: Optional[list[str]] = None
     cc_emails: Optional[list[str]] = None
+    report_content: Optional[str] = None  # skips the file read when provided
 
 
 class SendEmailResponse(BaseModel):
@@ -147,9 +192,66 @@ class SettingUpdate(BaseModel):
 
 
 # Helper function to get config
+@lru_cache(maxsize=1)
+def _cached_config() -> AppConfig:
+    return AppConfig.from_env()
+
+
+# Bumped whenever settings or recipients change; feeds the /api/config ETag
+_settings_version = 0
+
+
+@lru_cache(maxsize=1)
+def _reports_dir() -> Path:
+    """Reports directory, created once and cached until settings change."""
+    d = Path(_cached_config().output_dir or "reports")
+    d.mkdir(exist_ok=True)
+    return d
+
+
+# Reuse EmailSender instances across requests so the SMTP connection state
+# they hold survives between sends instead of being rebuilt per call.
+# A plain dict instead of lru_cache so evicted or cleared senders get
+# their authenticated SMTP connections closed, not silently dropped.
+_email_senders: dict[tuple[str, str, str], EmailSender] = {}
+_email_senders_lock = threading.Lock()
+_EMAIL_SENDER_CACHE_SIZE = 4
+
+
+def _email_sender(provider: str, username: str, password: str) -> EmailSender:
+    key = (provider, username, password)
+    with _email_senders_lock:
+        sender = _email_senders.get(key)
+        if sender is None:
+            if len(_email_senders) >= _EMAIL_SENDER_CACHE_SIZE:
+                _, evicted = _email_senders.popitem()
+                evicted.close()
+            sender = _email_senders[key] = EmailSender.from_provider(
+                provider, username, password
+            )
+        return sender
+
+
+def _close_email_senders():
+    with _email_senders_lock:
+        for sender in _email_senders.values():
+            sender.close()
+        _email_senders.clear()
+
+
+def _config_changed():
+    """Invalidate the cached config after a settings/recipients mutation."""
+    global _settings_version
+    _settings_version += 1
+    AppConfig.invalidate_cache()
+    _cached_config.cache_clear()
+    _reports_dir.cache_clear()
+    _close_email_senders()
+
+
 def get_config() -> AppConfig:
     try:
-        return AppConfig.from_env()
+        return _cached_config()
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -162,13 +264,19 @@ async def root():
 
 
 @app.get("/api/config", response_model=ConfigResponse)
-async def get_configuration():
+async def get_configuration(request: Request, response: Response):
     """Get current configuration status."""
+    etag = f'W/"config-{_settings_version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
     config = get_config()
     
     # Try to get recipients from database first, fallback to .env
-    db_recipients_to = RecipientsManager.get_email_list("to")
-    db_recipients_cc = RecipientsManager.get_email_list("cc")
+    db_recipients_to = await anyio.to_thread.run_sync(RecipientsManager.get_email_list, "to")
+    db_recipients_cc = await anyio.to_thread.run_sync(RecipientsManager.get_email_list, "cc")
     
     recipients_to = db_recipients_to if db_recipients_to else config.report.recipients_to
     recipients_cc = db_recipients_cc if db_recipients_cc else config.report.recipients_cc
@@ -184,19 +292,42 @@ async def get_configuration():
     )
 
 
+# Short-lived preview cache so UI polling doesn't hit Slack on every GET.
+# The lock coalesces concurrent misses into a single Slack fetch.
+_preview_cache: TTLCache = TTLCache(maxsize=16, ttl=60)
+_preview_lock = asyncio.Lock()
+
+
 @app.get("/api/preview")
 async def preview_messages(days: int = 7):
     """Preview daily report threads from the last N days."""
     config = get_config()
-    
+
+    cache_key = (config.slack.channel_id, days)
+    cached = _preview_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async with _preview_lock:
+        # Another request may have populated the cache while we waited
+        cached = _preview_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        response = await _build_preview(config, days)
+        _preview_cache[cache_key] = response
+        return response
+
+
+async def _build_preview(config: AppConfig, days: int) -> PreviewResponse:
+    """Fetch daily report threads from Slack and build the preview payload."""
     try:
         slack_client = SlackClient(config.slack)
-        
+
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
-        
-        daily_reports = slack_client.find_daily_report_threads(start_date, end_date)
-        
+
+        daily_reports = await slack_client.find_daily_report_threads_async(start_date, end_date)
+
         # Format for response
         reports_data = []
         total_updates = 0
@@ -222,13 +353,8 @@ async def preview_messages(days: int = 7):
             })
         
         # Calculate date range
-        date_range = None
-        if daily_reports:
-            dates = [r['date'] for r in daily_reports]
-            start = min(dates)
-            end = max(dates)
-            date_range = f"{start.strftime('%B %d')} to {end.strftime('%B %d, %Y')}"
-        
+        date_range = format_date_range(daily_reports)
+
         return PreviewResponse(
             daily_reports=reports_data,
             total_updates=total_updates,
@@ -252,7 +378,7 @@ async def get_threads_by_date_range(from_date: str, to_date: str):
         if start > end:
             start, end = end, start
         slack_client = SlackClient(config.slack)
-        daily_reports = slack_client.find_daily_report_threads(start, end)
+        daily_reports = await slack_client.find_daily_report_threads_async(start, end)
         threads_data = []
         for report in daily_reports:
             header = report['header']
@@ -266,7 +392,7 @@ async def get_threads_by_date_range(from_date: str, to_date: str):
                 }
                 for r in replies[:3]
             ]
-            threads_data.append(ThreadItem(
+            threads_data.append(ThreadItem.model_construct(
                 thread_ts=thread_ts,
                 date=report['date'].strftime("%Y-%m-%d"),
                 header_text=header.text[:300],
@@ -296,19 +422,15 @@ async def generate_report_from_selection(request: GenerateFromSelectionRequest):
         )
     try:
         slack_client = SlackClient(config.slack)
-        status_messages, thread_infos = slack_client.get_threads_by_ts(request.thread_ts_list)
+        status_messages, thread_infos = await slack_client.get_threads_by_ts_async(
+            request.thread_ts_list
+        )
         if not status_messages:
             return GenerateReportResponse(
                 success=False,
                 error="Selected threads have no reply messages (status updates).",
             )
-        if thread_infos:
-            dates = [t['date'] for t in thread_infos]
-            start_date = min(dates)
-            end_date = max(dates)
-            date_range = f"{start_date.strftime('%B %d')} to {end_date.strftime('%B %d, %Y')}"
-        else:
-            date_range = "Selected period"
+        date_range = format_date_range(thread_infos) or "Selected period"
         parser = MessageParser()
         statuses = parser.parse_messages(status_messages)
         generator = ReportGenerator(
@@ -322,19 +444,22 @@ async def generate_report_from_selection(request: GenerateFromSelectionRequest):
             enhancer = GroqReportEnhancer(config.groq.api_key)
             # Include author with each message so AI attributes items to the right person
             raw_texts = [f"--- From: {msg.user_name} ---\n\n{msg.text}" for msg in status_messages]
-            report = enhancer.enhance_report(
-                raw_texts,
-                date_range=date_range,
-                sender_name=config.report.sender_name,
+            report = await anyio.to_thread.run_sync(
+                partial(
+                    enhancer.enhance_report,
+                    raw_texts,
+                    date_range=date_range,
+                    sender_name=config.report.sender_name,
+                )
             )
         if not report:
             report = generator.generate(statuses, request.notes)
-        reports_dir = Path(config.output_dir or "reports")
-        reports_dir.mkdir(exist_ok=True)
+        reports_dir = _reports_dir()
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         filename = f"weekly_report_{timestamp}.txt"
         filepath = reports_dir / filename
-        filepath.write_text(report)
+        async with aiofiles.open(filepath, "w") as f:
+            await f.write(report)
         return GenerateReportResponse(
             success=True,
             report=report,
@@ -350,11 +475,10 @@ async def generate_report_from_selection(request: GenerateFromSelectionRequest):
         return GenerateReportResponse(success=False, error=str(e))
 
 
-@app.post("/api/generate", response_model=GenerateReportResponse)
-async def generate_report(request: GenerateReportRequest):
-    """Generate a weekly report."""
+async def _generate_report(request: GenerateReportRequest) -> GenerateReportResponse:
+    """Run the full generate pipeline; shared by the endpoint and job queue."""
     config = get_config()
-    
+
     try:
         slack_client = SlackClient(config.slack)
         
@@ -364,10 +488,21 @@ async def generate_report(request: GenerateReportRequest):
         week = request.week or now.isocalendar()[1]
         
         # Get status updates from daily report threads (fallback to last 7 days if week is empty)
-        status_messages, daily_reports, diagnostics = slack_client.get_weekly_status_updates(
-            year, week, fallback_days=7
+        slack_task = asyncio.create_task(
+            slack_client.get_weekly_status_updates_async(year, week, fallback_days=7)
         )
-        
+
+        # Build the parser and generator while the Slack fetch is in flight
+        parser = MessageParser()
+        generator = ReportGenerator(
+            sender_name=config.report.sender_name,
+            sender_email=config.report.sender_email,
+            recipients_to=config.report.recipients_to,
+            recipients_cc=config.report.recipients_cc,
+        )
+
+        status_messages, daily_reports, diagnostics = await slack_task
+
         if not status_messages:
             start_str = diagnostics["start"].strftime("%Y-%m-%d")
             end_str = diagnostics["end"].strftime("%Y-%m-%d")
@@ -384,50 +519,40 @@ async def generate_report(request: GenerateReportRequest):
             )
         
         # Calculate date range
-        if daily_reports:
-            dates = [r['date'] for r in daily_reports]
-            start_date = min(dates)
-            end_date = max(dates)
-            date_range = f"{start_date.strftime('%B %d')} to {end_date.strftime('%B %d, %Y')}"
-        else:
-            date_range = f"Week {week}, {year}"
+        date_range = format_date_range(daily_reports) or f"Week {week}, {year}"
         
         # Parse status updates
-        parser = MessageParser()
         statuses = parser.parse_messages(status_messages)
-        
-        # Generate report
-        generator = ReportGenerator(
-            sender_name=config.report.sender_name,
-            sender_email=config.report.sender_email,
-            recipients_to=config.report.recipients_to,
-            recipients_cc=config.report.recipients_cc,
-        )
-        
+
         # Use AI enhancement if requested and available
         report = None
         if request.use_ai and config.groq.is_available:
             enhancer = GroqReportEnhancer(config.groq.api_key)
             # Include author with each message so AI attributes items to the right person
             raw_texts = [f"--- From: {msg.user_name} ---\n\n{msg.text}" for msg in status_messages]
-            report = enhancer.enhance_report(
-                raw_texts,
-                date_range=date_range,
-                sender_name=config.report.sender_name
+            report = await anyio.to_thread.run_sync(
+                partial(
+                    enhancer.enhance_report,
+                    raw_texts,
+                    date_range=date_range,
+                    sender_name=config.report.sender_name,
+                )
             )
-        
+
         if not report:
             report = generator.generate(statuses, request.notes)
-        
+
         # Save report to file
-        reports_dir = Path(config.output_dir or "reports")
-        reports_dir.mkdir(exist_ok=True)
-        
+        reports_dir = _reports_dir()
+
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         filename = f"weekly_report_{timestamp}.txt"
         filepath = reports_dir / filename
-        filepath.write_text(report)
-        
+        async with aiofiles.open(filepath, "w") as f:
+            await f.write(report)
+
+        await anyio.to_thread.run_sync(ReportHistoryManager.add, filename, date_range)
+
         return GenerateReportResponse(
             success=True,
             report=report,
@@ -439,7 +564,7 @@ async def generate_report(request: GenerateReportRequest):
                 "parsed_statuses": len(statuses),
             }
         )
-        
+
     except Exception as e:
         return GenerateReportResponse(
             success=False,
@@ -447,53 +572,161 @@ async def generate_report(request: GenerateReportRequest):
         )
 
 
+@app.post("/api/generate", response_model=GenerateReportResponse)
+async def generate_report(request: GenerateReportRequest):
+    """Generate a weekly report."""
+    return await _generate_report(request)
+
+
+# =============================================================================
+# Job Queue Endpoints
+# =============================================================================
+# Report generation can take many seconds (Slack pagination plus the AI
+# call), so clients that do not want to hold the request open can enqueue
+# a job and poll its status instead.
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str  # "queued", "running", "done", or "failed"
+    result: Optional[GenerateReportResponse] = None
+
+
+# Finished jobs stay pollable for an hour, then the TTLCache evicts
+# them so the table stays bounded in a long-running server.
+_jobs: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
+# The event loop holds only weak references to tasks, so an otherwise
+# unreferenced job task could be garbage-collected mid-run; keep strong
+# references until each task finishes.
+_job_tasks: set[asyncio.Task] = set()
+
+
+async def _run_generate_job(job: JobStatus, request: GenerateReportRequest):
+    """Execute a queued generate job and record its outcome."""
+    job.status = "running"
+    try:
+        job.result = await _generate_report(request)
+        job.status = "done" if job.result.success else "failed"
+    except Exception as e:
+        job.result = GenerateReportResponse(success=False, error=str(e))
+        job.status = "failed"
+
+
+@app.post("/api/jobs/generate", status_code=202)
+async def enqueue_generate_report(request: GenerateReportRequest):
+    """Enqueue a report generation job and return a job id immediately."""
+    job_id = uuid.uuid4().hex
+    job = _jobs[job_id] = JobStatus(job_id=job_id, status="queued")
+    task = asyncio.create_task(_run_generate_job(job, request))
+    _job_tasks.add(task)
+    task.add_done_callback(_job_tasks.discard)
+    return {"job_id": job_id, "status_url": f"/api/jobs/{job_id}"}
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """Get the status (and result, once finished) of a queued job."""
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _scan_report_entries(reports_dir: Path) -> list[os.DirEntry]:
+    """Enumerate report files newest-first with one directory read."""
+    with os.scandir(reports_dir) as it:
+        entries = [e for e in it if e.name.endswith(".txt") and e.is_file()]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return entries
+
+
 @app.get("/api/reports", response_model=list[ReportFile])
-async def list_reports():
-    """List all generated report files."""
+async def list_reports(request: Request, response: Response, stream: bool = False):
+    """List all generated report files.
+
+    Pass ?stream=1 for NDJSON (one report per line), which keeps memory
+    flat and starts the response at the first entry when the directory
+    holds thousands of reports.
+    """
     config = get_config()
-    reports_dir = Path(config.output_dir or "reports")
-    
+    reports_dir = _reports_dir()
+
     if not reports_dir.exists():
         return []
-    
-    files = []
-    for f in sorted(reports_dir.glob("*.txt"), key=lambda x: x.stat().st_mtime, reverse=True):
-        stat = f.stat()
-        files.append(ReportFile(
-            name=f.name,
-            path=str(f),
-            created=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            size=stat.st_size,
-        ))
-    
-    return files
+
+    # The directory mtime changes whenever a report is added or removed,
+    # so it makes a cheap ETag for polling clients.
+    etag = f'W/"reports-{reports_dir.stat().st_mtime_ns}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+    if stream:
+        def iter_ndjson():
+            for e in _scan_report_entries(reports_dir):
+                yield orjson.dumps({
+                    "name": e.name,
+                    "path": e.path,
+                    "created": datetime.fromtimestamp(e.stat().st_mtime).isoformat(),
+                    "size": e.stat().st_size,
+                }) + b"\n"
+
+        return StreamingResponse(
+            iter_ndjson(),
+            media_type="application/x-ndjson",
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
+
+    def scan_reports() -> list[ReportFile]:
+        # model_construct skips field validation; the values come straight
+        # from os.scandir, so there is nothing to validate.
+        return [
+            ReportFile.model_construct(
+                name=e.name,
+                path=e.path,
+                created=datetime.fromtimestamp(e.stat().st_mtime).isoformat(),
+                size=e.stat().st_size,
+            )
+            for e in _scan_report_entries(reports_dir)
+        ]
+
+    return await anyio.to_thread.run_sync(scan_reports)
 
 
 @app.get("/api/reports/{filename}")
-async def get_report(filename: str):
-    """Get content of a specific report file."""
+async def get_report(filename: str, raw: bool = False):
+    """Get a report file.
+
+    Streams the file directly by default; pass ?raw=1 for the JSON body
+    with the content embedded (used by the web UI).
+    """
     config = get_config()
-    reports_dir = Path(config.output_dir or "reports")
+    reports_dir = _reports_dir()
     filepath = reports_dir / filename
-    
+
     if not filepath.exists():
         raise HTTPException(status_code=404, detail="Report not found")
-    
-    content = filepath.read_text()
-    return {"filename": filename, "content": content}
+
+    if raw:
+        async with aiofiles.open(filepath, "r") as f:
+            content = await f.read()
+        return {"filename": filename, "content": content}
+
+    return FileResponse(filepath, filename=filename, media_type="text/plain")
 
 
 @app.delete("/api/reports/{filename}")
 async def delete_report(filename: str):
     """Delete a report file."""
     config = get_config()
-    reports_dir = Path(config.output_dir or "reports")
+    reports_dir = _reports_dir()
     filepath = reports_dir / filename
     
     if not filepath.exists():
         raise HTTPException(status_code=404, detail="Report not found")
     
-    filepath.unlink()
+    await aiofiles.os.remove(filepath)
     return {"success": True, "message": f"Deleted {filename}"}
 
 
@@ -508,14 +741,18 @@ async def send_email(request: SendEmailRequest):
             detail="Email not configured. Please set EMAIL_USERNAME and EMAIL_PASSWORD in .env"
         )
     
-    # Find report file
-    reports_dir = Path(config.output_dir or "reports")
-    filepath = reports_dir / request.report_file
-    
-    if not filepath.exists():
-        raise HTTPException(status_code=404, detail="Report file not found")
-    
-    report_content = filepath.read_text()
+    # Use the content the client already has, or read it from disk
+    if request.report_content is not None:
+        report_content = request.report_content
+    else:
+        reports_dir = _reports_dir()
+        filepath = reports_dir / request.report_file
+
+        if not filepath.exists():
+            raise HTTPException(status_code=404, detail="Report file not found")
+
+        async with aiofiles.open(filepath, "r") as f:
+            report_content = await f.read()
     
     # Generate subject if not provided
     subject = request.subject
@@ -524,27 +761,26 @@ async def send_email(request: SendEmailRequest):
         subject = f"End of Week Update - Week {now.isocalendar()[1]}, {now.year}"
     
     # Extract email addresses
-    def extract_email(recipient: str) -> str:
-        match = re.search(r'<([^>]+)>', recipient)
-        return match.group(1) if match else recipient.strip()
-    
     to_emails = request.to_emails or [extract_email(r) for r in config.report.recipients_to]
     cc_emails = request.cc_emails or [extract_email(r) for r in config.report.recipients_cc]
     
     try:
-        sender = EmailSender.from_provider(
+        sender = _email_sender(
             config.email.provider,
             config.email.username,
             config.email.password,
         )
-        
-        success = sender.send_report(
-            subject=subject,
-            body=report_content,
-            from_email=config.report.sender_email,
-            to_emails=to_emails,
-            cc_emails=cc_emails,
-            from_name=config.report.sender_name,
+
+        success = await anyio.to_thread.run_sync(
+            partial(
+                sender.send_report,
+                subject=subject,
+                body=report_content,
+                from_email=config.report.sender_email,
+                to_emails=to_emails,
+                cc_emails=cc_emails,
+                from_name=config.report.sender_name,
+            )
         )
         
         if success:
@@ -574,13 +810,13 @@ async def test_email_config():
         return {"success": False, "message": "Email not configured"}
     
     try:
-        sender = EmailSender.from_provider(
+        sender = _email_sender(
             config.email.provider,
             config.email.username,
             config.email.password,
         )
-        
-        if sender.test_connection():
+
+        if await anyio.to_thread.run_sync(sender.test_connection):
             return {"success": True, "message": "SMTP connection successful"}
         else:
             return {"success": False, "message": "SMTP connection failed"}
@@ -595,12 +831,14 @@ async def test_slack_config():
     config = get_config()
     
     try:
-        from slack_sdk import WebClient
-        client = WebClient(token=config.slack.bot_token)
-        
-        auth_response = client.auth_test()
-        channel_response = client.conversations_info(channel=config.slack.channel_id)
-        
+        from slack_sdk.web.async_client import AsyncWebClient
+        client = AsyncWebClient(token=config.slack.bot_token)
+
+        auth_response, channel_response = await asyncio.gather(
+            client.auth_test(),
+            client.conversations_info(channel=config.slack.channel_id),
+        )
+
         return {
             "success": True,
             "bot_name": auth_response.get("user"),
@@ -618,38 +856,49 @@ async def test_slack_config():
 @app.get("/api/recipients")
 async def list_recipients(active_only: bool = False):
     """List all recipients."""
-    recipients = RecipientsManager.get_all(active_only=active_only)
+    recipients = await anyio.to_thread.run_sync(
+        partial(RecipientsManager.get_all, active_only=active_only)
+    )
     return {"recipients": recipients}
 
 
 @app.post("/api/recipients")
 async def create_recipient(recipient: RecipientCreate):
     """Add a new recipient."""
-    recipient_id = RecipientsManager.add(
-        email=recipient.email,
-        name=recipient.name,
-        recipient_type=recipient.type,
+    recipient_id = await anyio.to_thread.run_sync(
+        partial(
+            RecipientsManager.add,
+            email=recipient.email,
+            name=recipient.name,
+            recipient_type=recipient.type,
+        )
     )
+    _config_changed()
     return {"success": True, "id": recipient_id, "message": f"Recipient {recipient.email} added"}
 
 
 @app.put("/api/recipients/{recipient_id}")
 async def update_recipient(recipient_id: int, recipient: RecipientUpdate):
     """Update a recipient."""
-    RecipientsManager.update(
-        recipient_id=recipient_id,
-        email=recipient.email,
-        name=recipient.name,
-        recipient_type=recipient.type,
-        active=recipient.active,
+    await anyio.to_thread.run_sync(
+        partial(
+            RecipientsManager.update,
+            recipient_id=recipient_id,
+            email=recipient.email,
+            name=recipient.name,
+            recipient_type=recipient.type,
+            active=recipient.active,
+        )
     )
+    _config_changed()
     return {"success": True, "message": "Recipient updated"}
 
 
 @app.delete("/api/recipients/{recipient_id}")
 async def delete_recipient(recipient_id: int):
     """Delete a recipient."""
-    RecipientsManager.delete(recipient_id)
+    await anyio.to_thread.run_sync(RecipientsManager.delete, recipient_id)
+    _config_changed()
     return {"success": True, "message": "Recipient deleted"}
 
 
@@ -660,29 +909,28 @@ async def delete_recipient(recipient_id: int):
 @app.get("/api/settings")
 async def get_settings():
     """Get all settings (sensitive values masked)."""
-    settings = SettingsManager.get_all()
+    settings = await anyio.to_thread.run_sync(SettingsManager.get_all)
     # Mask sensitive values
-    masked = {}
-    sensitive_keys = ["email_password", "slack_bot_token", "groq_api_key"]
-    for key, value in settings.items():
-        if key in sensitive_keys and value:
-            masked[key] = "***" + value[-4:] if len(value) > 4 else "****"
-        else:
-            masked[key] = value
+    masked = {
+        key: ("***" + value[-4:] if len(value) > 4 else "****")
+        if key in _SENSITIVE_KEYS and value
+        else value
+        for key, value in settings.items()
+    }
     return {"settings": masked}
 
 
 @app.get("/api/settings/raw")
 async def get_settings_raw():
     """Get all settings with actual values (for editing)."""
-    settings = SettingsManager.get_all()
+    settings = await anyio.to_thread.run_sync(SettingsManager.get_all)
     return {"settings": settings}
 
 
 @app.get("/api/settings/{key}")
 async def get_setting(key: str):
     """Get a specific setting."""
-    value = SettingsManager.get(key)
+    value = await anyio.to_thread.run_sync(SettingsManager.get, key)
     if value is None:
         raise HTTPException(status_code=404, detail=f"Setting '{key}' not found")
     return {"key": key, "value": value}
@@ -691,14 +939,16 @@ async def get_setting(key: str):
 @app.put("/api/settings/{key}")
 async def update_setting(key: str, setting: SettingUpdate):
     """Update a setting."""
-    SettingsManager.set(key, setting.value, setting.description)
+    await anyio.to_thread.run_sync(SettingsManager.set, key, setting.value, setting.description)
+    _config_changed()
     return {"success": True, "message": f"Setting '{key}' updated"}
 
 
 @app.delete("/api/settings/{key}")
 async def delete_setting(key: str):
     """Delete a setting (reset to default)."""
-    SettingsManager.delete(key)
+    await anyio.to_thread.run_sync(SettingsManager.delete, key)
+    _config_changed()
     return {"success": True, "message": f"Setting '{key}' deleted"}
 
 
@@ -710,8 +960,11 @@ async def import_settings_from_env(force: bool = True):
         force: If True, overwrite existing settings and recipients.
     """
     try:
-        SettingsManager.initialize_from_env()
-        recipient_count = RecipientsManager.initialize_from_env(force=force)
+        await anyio.to_thread.run_sync(SettingsManager.initialize_from_env)
+        recipient_count = await anyio.to_thread.run_sync(
+            partial(RecipientsManager.initialize_from_env, force=force)
+        )
+        _config_changed()
         return {
             "success": True, 
             "message": f"Settings imported from .env file. {recipient_count} recipients imported."
@@ -727,10 +980,19 @@ async def import_settings_from_env(force: bool = True):
 @app.get("/api/history")
 async def get_report_history(limit: int = 20):
     """Get report generation history."""
-    history = ReportHistoryManager.get_recent(limit)
+    history = await anyio.to_thread.run_sync(ReportHistoryManager.get_recent, limit)
     return {"history": history}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Single worker on purpose: the in-process job table, settings ETag
+    # counter and cache invalidation are all per-process, so a second
+    # worker would 404 jobs and serve stale settings.
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -2,23 +2,38 @@
 Command-line interface for the report generator.
 """
 
+import re
+
 import click
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import AppConfig
-from .slack_client import SlackClient
-from .message_parser import MessageParser
-from .report_generator import ReportGenerator, GroqReportEnhancer
 
+# Heavy imports (slack_sdk, parser, generator) happen inside the commands
+# that need them so `--help` and non-network commands start fast.
 
 console = Console()
 
+# Matches the address part of "Name <email>" recipients
+_EMAIL_ANGLE_RE = re.compile(r"<([^>]+)>")
+
+
+def extract_email(recipient: str) -> str:
+    """Extract the bare address from a 'Name <email>' recipient string."""
+    match = _EMAIL_ANGLE_RE.search(recipient)
+    return match.group(1) if match else recipient.strip()
+
+
+def _preview_text(text: str, limit: int, sep: str = " ") -> str:
+    """Truncate to limit chars and flatten newlines without extra copies."""
+    if len(text) > limit:
+        return text[:limit].replace("\n", sep) + "..."
+    return text.replace("\n", sep)
+
 
 @click.group()
 @click.version_option(version="1.0.0")
@@ -47,7 +62,7 @@ def cli():
 @click.option(
     "--output",
     "-o",
-    type=click.Path(),
+    type=click.Path(path_type=Path),
     default=None,
     help="Output file path (default: print to console)",
 )
@@ -62,9 +77,20 @@ def cli():
     multiple=True,
     help="Additional notes to include in the report (can be used multiple times)",
 )
-def generate(week: int, year: int, output: str, ai: bool, notes: tuple):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the on-disk Slack cache and refetch this week's messages",
+)
+def generate(week: int, year: int, output: Path, ai: bool, notes: tuple, no_cache: bool):
     """Generate a weekly status report from Slack messages."""
-    
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from .slack_client import SlackClient
+    from .message_parser import get_parser
+    from .report_generator import ReportGenerator, GroqReportEnhancer
+
     try:
         config = AppConfig.from_env()
     except ValueError as e:
@@ -72,12 +98,12 @@ def generate(week: int, year: int, output: str, ai: bool, notes: tuple):
         console.print("\nPlease copy .env.example to .env and configure your credentials.")
         raise click.Abort()
 
-    # Determine the week to report on
+    # Determine the week to report on (single clock read, named tuple field)
     now = datetime.now()
     if year is None:
         year = now.year
     if week is None:
-        week = now.isocalendar()[1]
+        week = now.isocalendar().week
 
     console.print(Panel(
         f"Generating report for Week {week}, {year}",
@@ -98,7 +124,7 @@ def generate(week: int, year: int, output: str, ai: bool, notes: tuple):
         
         # Get status updates from daily report threads (fallback to last 7 days if week is empty)
         status_messages, daily_reports, diagnostics = slack_client.get_weekly_status_updates(
-            year, week, fallback_days=7
+            year, week, fallback_days=7, use_cache=not no_cache
         )
         
         if diagnostics.get("used_fallback"):
@@ -119,7 +145,7 @@ def generate(week: int, year: int, output: str, ai: bool, notes: tuple):
 
         # Parse status updates
         progress.update(task, description="Parsing status updates...")
-        parser = MessageParser()
+        parser = get_parser()
         statuses = parser.parse_messages(status_messages)
         
         console.print(f"✓ Parsed [green]{len(statuses)}[/green] structured status updates")
@@ -137,48 +163,66 @@ def generate(week: int, year: int, output: str, ai: bool, notes: tuple):
         if ai and config.groq.is_available:
             progress.update(task, description="Enhancing report with Groq AI...")
             enhancer = GroqReportEnhancer(config.groq.api_key)
-            # Include author with each message so AI attributes items to the right person
-            raw_texts = [f"--- From: {msg.user_name} ---\n\n{msg.text}" for msg in status_messages]
+            # Include author with each message so AI attributes items to the right person.
+            # Generator: enhance_report only joins the texts once, no need for a list.
+            raw_texts = (f"--- From: {msg.user_name} ---\n\n{msg.text}" for msg in status_messages)
             
-            # Calculate date range from daily reports
+            # Calculate date range from daily reports in one pass
             if daily_reports:
-                dates = [r['date'] for r in daily_reports]
-                start_date = min(dates)
-                end_date = max(dates)
+                start_date = end_date = daily_reports[0]["date"]
+                for report_info in daily_reports[1:]:
+                    d = report_info["date"]
+                    if d < start_date:
+                        start_date = d
+                    elif d > end_date:
+                        end_date = d
                 date_range = f"{start_date.strftime('%B %d')} to {end_date.strftime('%B %d, %Y')}"
             else:
                 date_range = f"Week {week}, {year}"
             
             enhanced = enhancer.enhance_report(
-                raw_texts, 
+                raw_texts,
                 date_range=date_range,
-                sender_name=config.report.sender_name
+                sender_name=config.report.sender_name,
+                use_cache=not no_cache,
             )
             
             if enhanced:
                 report = enhanced
             else:
                 console.print("[yellow]Groq AI enhancement failed, using standard report.[/yellow]")
-                report = generator.generate(statuses, list(notes))
+                report = None
         else:
-            report = generator.generate(statuses, list(notes))
+            report = None
 
         progress.update(task, description="Done!")
 
     # Output the report
     if output:
-        output_path = Path(output)
-        output_path.write_text(report)
-        console.print(f"\n✓ Report saved to [green]{output_path}[/green]")
+        if report is not None:
+            output.write_text(report)
+        else:
+            # Stream sections to disk instead of building the full string
+            with output.open("w", encoding="utf-8", buffering=65536) as f:
+                for i, section in enumerate(
+                    filter(None, generator.iter_sections(statuses, list(notes)))
+                ):
+                    if i:
+                        f.write("\n")
+                    f.write(section)
+        console.print(f"\n✓ Report saved to [green]{output}[/green]")
     else:
+        if report is None:
+            report = generator.generate(statuses, list(notes))
         console.print("\n")
         console.print(Panel(report, title="📋 Weekly Report", border_style="green"))
 
     # Show summary
+    unique_authors = {s.author for s in statuses}
     console.print("\n[bold]Report Summary:[/bold]")
     console.print(f"  • Daily report threads: {len(daily_reports)}")
     console.print(f"  • Status messages: {len(status_messages)}")
-    console.print(f"  • Team members: {len(set(s.author for s in statuses))}")
+    console.print(f"  • Team members: {len(unique_authors)}")
 
 
 @cli.command()
@@ -194,9 +238,11 @@ def test_connection():
     console.print("Testing Slack connection...")
     
     try:
-        from slack_sdk import WebClient
-        client = WebClient(token=config.slack.bot_token)
-        
+        from .slack_client import SlackClient
+
+        # Reuse the wrapped client rather than re-initializing the SDK
+        client = SlackClient(config.slack).client
+
         # Test auth
         auth_response = client.auth_test()
         console.print(f"✓ Connected as: [green]{auth_response['user']}[/green]")
@@ -223,7 +269,9 @@ def test_connection():
 )
 def preview(days: int):
     """Preview daily report threads that would be included in the report."""
-    
+
+    from .slack_client import SlackClient
+
     try:
         config = AppConfig.from_env()
     except ValueError as e:
@@ -244,13 +292,15 @@ def preview(days: int):
         console.print("\n[yellow]No daily report threads found.[/yellow]")
         console.print("Looking for messages containing 'Daily report', 'status update', or 'standup'...")
         
-        # Show all messages for debugging
+        # Show all messages for debugging; one batched print with the
+        # markup/highlight scanners off, since these lines are plain text
         console.print("\n[dim]All messages in date range:[/dim]")
         messages = slack_client.get_channel_messages(start_date, end_date)
+        lines = []
         for msg in messages[:20]:  # Show first 20
-            text_preview = msg.text[:100] + "..." if len(msg.text) > 100 else msg.text
-            text_preview = text_preview.replace("\n", " ")
-            console.print(f"  • {msg.user_name}: {text_preview}")
+            lines.append(f"  • {msg.user_name}: {_preview_text(msg.text, 100)}")
+        if lines:
+            console.print("\n".join(lines), markup=False, highlight=False, emoji=False)
         return
     
     console.print(f"\nFound [green]{len(daily_reports)}[/green] daily report threads\n")
@@ -273,11 +323,13 @@ def preview(days: int):
         # Show thread replies (status updates)
         if replies:
             console.print("  [bold]Status Updates:[/bold]")
+            lines = []
             for reply in replies:
-                text_preview = reply.text[:150] + "..." if len(reply.text) > 150 else reply.text
-                text_preview = text_preview.replace("\n", " | ")
-                console.print(f"    • [green]{reply.user_name}[/green]: {text_preview}")
+                text_preview = _preview_text(reply.text, 150, sep=" | ")
+                lines.append(f"    • [green]{reply.user_name}[/green]: {text_preview}")
                 total_updates += 1
+            # One print per thread instead of one per reply
+            console.print("\n".join(lines), highlight=False)
         else:
             console.print("  [dim]No thread replies found[/dim]")
         
@@ -287,11 +339,11 @@ def preview(days: int):
 
 
 @cli.command()
-@click.argument("template_file", type=click.Path(exists=True))
-def from_template(template_file: str):
+@click.argument("template_file", type=click.Path(exists=True, path_type=Path))
+def from_template(template_file: Path):
     """Generate a report using a custom template file."""
-    
-    template = Path(template_file).read_text()
+
+    template = template_file.read_text()
     console.print(f"Loaded template from: {template_file}")
     console.print("\n[yellow]Custom template support coming soon![/yellow]")
 
@@ -299,7 +351,7 @@ def from_template(template_file: str):
 
 
 @cli.command()
-@click.argument("report_file", type=click.Path(exists=True))
+@click.argument("report_file", type=click.Path(exists=True, path_type=Path))
 @click.option(
     "--subject",
     "-s",
@@ -311,7 +363,7 @@ def from_template(template_file: str):
     is_flag=True,
     help="Show what would be sent without actually sending",
 )
-def send(report_file: str, subject: str, dry_run: bool):
+def send(report_file: Path, subject: str, dry_run: bool):
     """Send a generated report via email to configured recipients."""
     
     try:
@@ -337,20 +389,14 @@ def send(report_file: str, subject: str, dry_run: bool):
         raise click.Abort()
 
     # Read report file
-    report_path = Path(report_file)
-    report_content = report_path.read_text()
+    report_content = report_file.read_text()
 
     # Generate subject if not provided
     if subject is None:
         now = datetime.now()
-        subject = f"End of Week Update - Week {now.isocalendar()[1]}, {now.year}"
+        subject = f"End of Week Update - Week {now.isocalendar().week}, {now.year}"
 
     # Extract email addresses (remove display names like "Name <email>")
-    import re
-    def extract_email(recipient: str) -> str:
-        match = re.search(r'<([^>]+)>', recipient)
-        return match.group(1) if match else recipient.strip()
-
     to_emails = [extract_email(r) for r in config.report.recipients_to]
     cc_emails = [extract_email(r) for r in config.report.recipients_cc]
 
@@ -5,40 +5,62 @@ Supports loading from SQLite database with fallback to environment variables.
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
-
+# .env loading is deferred to the first setting lookup so commands that
+# never touch config skip the filesystem walk load_dotenv() performs.
+_dotenv_loaded = False
+
+# Map database keys to environment variable names (built once at import)
+_ENV_MAPPING = {
+    "slack_bot_token": "SLACK_BOT_TOKEN",
+    "slack_channel_id": "SLACK_CHANNEL_ID",
+    "groq_api_key": "GROQ_API_KEY",
+    "sender_name": "SENDER_NAME",
+    "sender_email": "SENDER_EMAIL",
+    "email_provider": "EMAIL_PROVIDER",
+    "email_username": "EMAIL_USERNAME",
+    "email_password": "EMAIL_PASSWORD",
+    "report_output_dir": "REPORT_OUTPUT_DIR",
+}
+
+
+def _ensure_dotenv():
+    """Load the .env file once, on first use."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+@lru_cache(maxsize=64)
 def get_setting(key: str, default: str = None) -> Optional[str]:
     """Get a setting from database first, then fall back to environment variable."""
+    _ensure_dotenv()
     try:
         from src.database import SettingsManager
-        if SettingsManager.key_in_db(key):
-            return SettingsManager.get(key)
+        value = SettingsManager.get_or_none(key)
+        if value is not None:
+            return value
     except Exception:
         pass  # Database not available, use env vars
-    
-    # Map database keys to environment variable names
-    env_mapping = {
-        "slack_bot_token": "SLACK_BOT_TOKEN",
-        "slack_channel_id": "SLACK_CHANNEL_ID",
-        "groq_api_key": "GROQ_API_KEY",
-        "sender_name": "SENDER_NAME",
-        "sender_email": "SENDER_EMAIL",
-        "email_provider": "EMAIL_PROVIDER",
-        "email_username": "EMAIL_USERNAME",
-        "email_password": "EMAIL_PASSWORD",
-        "report_output_dir": "REPORT_OUTPUT_DIR",
-    }
-    
-    env_key = env_mapping.get(key, key.upper())
+
+    env_key = _ENV_MAPPING.get(key, key.upper())
     return os.getenv(env_key, default)
 
 
-@dataclass
+def _parse_csv_list(value: str) -> list[str]:
+    """Split a comma-separated env value, dropping blanks and duplicates.
+
+    dict.fromkeys keeps first-seen order, so duplicate addresses in the
+    env var cannot produce duplicate emails.
+    """
+    return list(dict.fromkeys(x for x in (p.strip() for p in value.split(",")) if x))
+
+
+@dataclass(slots=True, frozen=True)
 class SlackConfig:
     """Slack API configuration."""
     bot_token: str
@@ -58,7 +80,7 @@ class SlackConfig:
         return cls(bot_token=bot_token, channel_id=channel_id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroqConfig:
     """Groq AI API configuration (optional)."""
     api_key: Optional[str]
@@ -75,7 +97,7 @@ class GroqConfig:
         return bool(self.api_key)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportConfig:
     """Report generation configuration."""
     sender_name: str
@@ -102,12 +124,10 @@ class ReportConfig:
         
         # Fall back to environment variables if no database recipients
         if not recipients_to:
-            recipients_to_str = os.getenv("REPORT_RECIPIENTS_TO", "")
-            recipients_to = [r.strip() for r in recipients_to_str.split(",") if r.strip()]
-        
+            recipients_to = _parse_csv_list(os.getenv("REPORT_RECIPIENTS_TO", ""))
+
         if not recipients_cc:
-            recipients_cc_str = os.getenv("REPORT_RECIPIENTS_CC", "")
-            recipients_cc = [r.strip() for r in recipients_cc_str.split(",") if r.strip()]
+            recipients_cc = _parse_csv_list(os.getenv("REPORT_RECIPIENTS_CC", ""))
 
         return cls(
             sender_name=sender_name,
@@ -122,7 +142,7 @@ class ReportConfig:
         return self.recipients_to + self.recipients_cc
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailConfig:
     """Email sending configuration (optional)."""
     provider: str
@@ -144,7 +164,11 @@ class EmailConfig:
         return bool(self.username and self.password)
 
 
-@dataclass
+# Cached AppConfig singleton; building one costs a DB/env lookup per field
+_cached_app_config: Optional["AppConfig"] = None
+
+
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Main application configuration."""
     slack: SlackConfig
@@ -155,11 +179,25 @@ class AppConfig:
 
     @classmethod
     def from_env(cls) -> "AppConfig":
-        """Create all configurations from database/environment variables."""
-        return cls(
-            slack=SlackConfig.from_env(),
-            groq=GroqConfig.from_env(),
-            report=ReportConfig.from_env(),
-            email=EmailConfig.from_env(),
-            output_dir=get_setting("report_output_dir", "reports"),
-        )
+        """Create all configurations from database/environment variables.
+
+        The result is cached for the life of the process; call
+        invalidate_cache() after changing settings or recipients.
+        """
+        global _cached_app_config
+        if _cached_app_config is None:
+            _cached_app_config = cls(
+                slack=SlackConfig.from_env(),
+                groq=GroqConfig.from_env(),
+                report=ReportConfig.from_env(),
+                email=EmailConfig.from_env(),
+                output_dir=get_setting("report_output_dir", "reports"),
+            )
+        return _cached_app_config
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop the cached config so the next from_env() rebuilds it."""
+        global _cached_app_config
+        _cached_app_config = None
+        get_setting.cache_clear()
@@ -2,8 +2,12 @@
 SQLite database for managing settings, recipients, and configuration.
 """
 
+import os
+import re
 import sqlite3
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -13,29 +17,91 @@ from contextlib import contextmanager
 DB_PATH = Path(__file__).parent.parent / "data" / "settings.db"
 
 
+# Tracks whether the data directory has been created, so get_db_path()
+# doesn't re-stat it on every call.
+_db_dir_ready = False
+
+
 def get_db_path() -> Path:
     """Get the database file path, creating the directory if needed."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    global _db_dir_ready
+    if not _db_dir_ready:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _db_dir_ready = True
     return DB_PATH
 
 
+# One connection per thread, opened lazily and kept for the life of the
+# process. Reconnecting on every query costs an open()/close() of the db
+# (plus -wal/-shm files) each time and forfeits WAL's concurrent readers.
+_local = threading.local()
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """Get (or create) this thread's long-lived connection."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        # cached_statements keeps compiled queries in the driver's LRU so
+        # repeated lookups skip SQLite's parse/codegen step entirely
+        # isolation_level=None: autocommit for reads, with write
+        # transactions opened explicitly by get_connection()
+        conn = sqlite3.connect(
+            get_db_path(), cached_statements=256, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-64000;"
+            "PRAGMA mmap_size=268435456;"
+        )
+        _local.conn = conn
+    return conn
+
+
 @contextmanager
 def get_connection():
-    """Get a database connection with context management."""
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
+    """Get a database connection for writes.
+
+    Yields the per-thread cached connection inside an explicit
+    BEGIN IMMEDIATE transaction; commits on success, rolls back on
+    error, and never closes the connection.
+    """
+    conn = _thread_connection()
+    conn.execute("BEGIN IMMEDIATE")
     try:
         yield conn
-        conn.commit()
-    finally:
-        conn.close()
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+@contextmanager
+def read_connection():
+    """Get a database connection for SELECT-only work.
+
+    Skips the commit that get_connection() issues — a no-op commit still
+    does journal bookkeeping, and reads under WAL need none of it.
+    """
+    yield _thread_connection()
+
+
+# Bump whenever init_database() gains new tables or indexes so existing
+# databases rerun the (idempotent) schema statements once.
+SCHEMA_VERSION = 2
 
 
 def init_database():
-    """Initialize the database schema."""
+    """Initialize the database schema (no-op once the schema is current)."""
+    with read_connection() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+
     with get_connection() as conn:
         cursor = conn.cursor()
-        
+
         # Settings table for key-value pairs
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS settings (
@@ -70,8 +136,83 @@ def init_database():
                 status TEXT DEFAULT 'generated'
             )
         """)
-        
-        conn.commit()
+
+        # Recipients a report was sent to, one row per address. Replaces
+        # JSON blobs in report_history.sent_to (kept for legacy rows).
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS report_recipients (
+                report_id INTEGER,
+                email TEXT,
+                FOREIGN KEY(report_id) REFERENCES report_history(id)
+            )
+        """)
+
+        # Indexes for the common query shapes: recipients filtered by
+        # type/active, history ordered by generated_at. settings.key is
+        # already the primary key. ANALYZE keeps the planner informed.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recipients_type_active
+            ON recipients(type, active) WHERE active = 1
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_report_history_generated
+            ON report_history(generated_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_report_recipients_report
+            ON report_recipients(report_id)
+        """)
+        cursor.execute("ANALYZE")
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+@lru_cache(maxsize=4)
+def _parse_env_file(mtime_ns: int):
+    """Parse .env for the given mtime; cached so unchanged files are free."""
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+
+
+def _reload_env():
+    """Re-read .env only when the file actually changed (one stat call)."""
+    from dotenv import find_dotenv
+    path = find_dotenv(usecwd=True)
+    if not path:
+        return
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return
+    _parse_env_file(mtime_ns)
+
+
+# Hot-path SQL hoisted to a constant: the identical string object
+# maximizes hits in the connection's prepared-statement cache.
+_SQL_UPSERT_SETTING = """
+    INSERT INTO settings (key, value, description, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        description = COALESCE(excluded.description, settings.description),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+# Whole-table settings cache. Settings change rarely, so reads are served
+# from memory; set()/delete() keep the cache in step with the database.
+_settings_cache: Optional[dict] = None
+_settings_lock = threading.Lock()
+
+
+def _load_settings() -> dict:
+    """Get the cached settings dict, loading it from the DB on first use."""
+    global _settings_cache
+    with _settings_lock:
+        if _settings_cache is None:
+            with read_connection() as conn:
+                rows = conn.execute("SELECT key, value FROM settings").fetchall()
+            _settings_cache = {row["key"]: row["value"] for row in rows}
+        return _settings_cache
 
 
 # Settings Management
@@ -94,67 +235,59 @@ class SettingsManager:
     @classmethod
     def key_in_db(cls, key: str) -> bool:
         """Return True if the key exists in the database (even with empty value)."""
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM settings WHERE key = ?", (key,))
-            return cursor.fetchone() is not None
+        return key in _load_settings()
+
+    @classmethod
+    def get_or_none(cls, key: str) -> Optional[str]:
+        """Get a setting value, or None if the key is not in the database.
+
+        No DEFAULTS fallback — lets callers distinguish "not set" from an
+        empty value without a separate existence check.
+        """
+        return _load_settings().get(key)
 
     @classmethod
     def get(cls, key: str, default: str = None) -> Optional[str]:
         """Get a setting value. Uses DB first, then default/DEFAULTS."""
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            if row:
-                return row["value"]
-            return default or cls.DEFAULTS.get(key)
-    
+        settings = _load_settings()
+        if key in settings:
+            return settings[key]
+        return default or cls.DEFAULTS.get(key)
+
     @classmethod
     def set(cls, key: str, value: str, description: str = None):
         """Set a setting value."""
         with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO settings (key, value, description, updated_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(key) DO UPDATE SET 
-                    value = excluded.value,
-                    description = COALESCE(excluded.description, settings.description),
-                    updated_at = CURRENT_TIMESTAMP
-            """, (key, value, description))
-    
+            cursor.execute(_SQL_UPSERT_SETTING, (key, value, description))
+        with _settings_lock:
+            if _settings_cache is not None:
+                _settings_cache[key] = value
+
     @classmethod
     def get_all(cls) -> dict:
         """Get all settings."""
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT key, value, description FROM settings")
-            rows = cursor.fetchall()
-            
-            # Start with defaults, then override with DB values
-            settings = cls.DEFAULTS.copy()
-            for row in rows:
-                settings[row["key"]] = row["value"]
-            
-            return settings
-    
+        # Start with defaults, then override with DB values
+        settings = cls.DEFAULTS.copy()
+        settings.update(_load_settings())
+        return settings
+
     @classmethod
     def delete(cls, key: str):
         """Delete a setting."""
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM settings WHERE key = ?", (key,))
+        with _settings_lock:
+            if _settings_cache is not None:
+                _settings_cache.pop(key, None)
     
     @classmethod
     def initialize_from_env(cls):
         """Initialize settings from environment variables (overwrites existing)."""
-        import os
-        from dotenv import load_dotenv
-        
-        # Reload .env to get latest values
-        load_dotenv(override=True)
-        
+        # Reload .env to get latest values (no-op unless the file changed)
+        _reload_env()
+
         env_mappings = {
             "SENDER_NAME": "sender_name",
             "SENDER_EMAIL": "sender_email",
@@ -167,10 +300,25 @@ class SettingsManager:
             "REPORT_OUTPUT_DIR": "report_output_dir",
         }
         
+        rows = []
         for env_key, db_key in env_mappings.items():
             value = os.getenv(env_key)
             if value:
-                cls.set(db_key, value, f"Imported from {env_key}")
+                rows.append((db_key, value, f"Imported from {env_key}"))
+
+        if rows:
+            # One executemany + one commit instead of an upsert per key
+            with get_connection() as conn:
+                conn.executemany(_SQL_UPSERT_SETTING, rows)
+            with _settings_lock:
+                if _settings_cache is not None:
+                    for db_key, value, _ in rows:
+                        _settings_cache[db_key] = value
+
+
+# Matches one comma-separated recipient: either "Name <email>" (groups 1, 2)
+# or a bare address (group 3), with surrounding whitespace absorbed.
+_RECIPIENT_RE = re.compile(r"\s*(?:([^,<]+?)\s*<([^>]+)>|([^,\s][^,]*?))\s*(?:,|$)")
 
 
 # Recipients Management
@@ -189,7 +337,23 @@ class RecipientsManager:
             return cursor.lastrowid
     
     @classmethod
-    def update(cls, recipient_id: int, email: str = None, name: str = None, 
+    def add_many(cls, rows: list[tuple]) -> int:
+        """Insert many (email, name, type) rows in one transaction.
+
+        One executemany + one commit instead of a connection cycle and
+        fsync per recipient.
+        """
+        if not rows:
+            return 0
+        with get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO recipients (email, name, type, active)
+                VALUES (?, ?, ?, 1)
+            """, rows)
+        return len(rows)
+
+    @classmethod
+    def update(cls, recipient_id: int, email: str = None, name: str = None,
                recipient_type: str = None, active: bool = None):
         """Update a recipient."""
         with get_connection() as conn:
@@ -228,55 +392,60 @@ class RecipientsManager:
     @classmethod
     def get_all(cls, active_only: bool = False) -> list[dict]:
         """Get all recipients."""
-        with get_connection() as conn:
+        with read_connection() as conn:
             cursor = conn.cursor()
-            
+            cursor.row_factory = None  # plain tuples; dicts built directly
+
             query = "SELECT id, email, name, type, active, created_at FROM recipients"
             if active_only:
                 query += " WHERE active = 1"
             query += " ORDER BY type, name, email"
-            
+
             cursor.execute(query)
-            return [dict(row) for row in cursor.fetchall()]
+            cols = [c[0] for c in cursor.description]
+            return [dict(zip(cols, row)) for row in cursor.fetchall()]
     
     @classmethod
     def get_by_type(cls, recipient_type: str, active_only: bool = True) -> list[dict]:
         """Get recipients by type (to or cc)."""
-        with get_connection() as conn:
+        with read_connection() as conn:
             cursor = conn.cursor()
-            
+            cursor.row_factory = None
+
             query = "SELECT id, email, name, type FROM recipients WHERE type = ?"
             params = [recipient_type]
-            
+
             if active_only:
                 query += " AND active = 1"
-            
+
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            cols = [c[0] for c in cursor.description]
+            return [dict(zip(cols, row)) for row in cursor.fetchall()]
     
     @classmethod
     def get_email_list(cls, recipient_type: str = None) -> list[str]:
         """Get list of email addresses, optionally filtered by type."""
-        with get_connection() as conn:
+        with read_connection() as conn:
             cursor = conn.cursor()
-            
-            query = "SELECT email, name FROM recipients WHERE active = 1"
+            cursor.row_factory = None
+
+            # Format "Name <email>" in SQL so Python just collects strings
+            query = """
+                SELECT CASE
+                    WHEN name IS NOT NULL AND name != ''
+                    THEN name || ' <' || email || '>'
+                    ELSE email
+                END
+                FROM recipients WHERE active = 1
+            """
             params = []
-            
+
             if recipient_type:
                 query += " AND type = ?"
                 params.append(recipient_type)
-            
+
             cursor.execute(query, params)
-            
-            emails = []
-            for row in cursor.fetchall():
-                if row["name"]:
-                    emails.append(f"{row['name']} <{row['email']}>")
-                else:
-                    emails.append(row["email"])
-            
-            return emails
+            return [row[0] for row in cursor.fetchall()]
     
     @classmethod
     def clear_all(cls):
@@ -292,56 +461,34 @@ class RecipientsManager:
         Args:
             force: If True, clear existing recipients before importing.
         """
-        import os
-        import re
-        from dotenv import load_dotenv
-        
-        # Reload .env to get latest values
-        load_dotenv(override=True)
-        
+        # Reload .env to get latest values (no-op unless the file changed)
+        _reload_env()
+
         # Check if we already have recipients (unless forcing)
         if not force and cls.get_all():
             return 0
-        
+
         # Clear existing if forcing
         if force:
             cls.clear_all()
-        
+
         def parse_recipients(value: str) -> list[tuple[str, str]]:
-            """Parse 'Name <email>' or 'email' format."""
-            if not value:
-                return []
-            
-            results = []
-            for part in value.split(","):
-                part = part.strip()
-                if not part:
-                    continue
-                
-                # Try to parse "Name <email>" format
-                match = re.match(r"([^<]+)\s*<([^>]+)>", part)
-                if match:
-                    results.append((match.group(2).strip(), match.group(1).strip()))
-                else:
-                    results.append((part, None))
-            
-            return results
-        
-        count = 0
-        
-        # Import TO recipients
-        to_recipients = os.getenv("REPORT_RECIPIENTS_TO", "")
-        for email, name in parse_recipients(to_recipients):
-            cls.add(email, name, "to")
-            count += 1
+            """Parse 'Name <email>' or 'email' format in one regex scan."""
+            return [
+                (m.group(2).strip() if m.group(2) else m.group(3), m.group(1))
+                for m in _RECIPIENT_RE.finditer(value)
+            ]
         
-        # Import CC recipients
-        cc_recipients = os.getenv("REPORT_RECIPIENTS_CC", "")
-        for email, name in parse_recipients(cc_recipients):
-            cls.add(email, name, "cc")
-            count += 1
-        
-        return count
+        # Import TO and CC recipients with a single batched insert
+        rows = [
+            (email, name, "to")
+            for email, name in parse_recipients(os.getenv("REPORT_RECIPIENTS_TO", ""))
+        ]
+        rows.extend(
+            (email, name, "cc")
+            for email, name in parse_recipients(os.getenv("REPORT_RECIPIENTS_CC", ""))
+        )
+        return cls.add_many(rows)
 
 
 # Report History Management
@@ -361,36 +508,56 @@ class ReportHistoryManager:
     
     @classmethod
     def mark_sent(cls, report_id: int, sent_to: list[str]):
-        """Mark a report as sent."""
+        """Mark a report as sent.
+
+        Recipients go into report_recipients rows (no JSON round-trip);
+        one transaction covers the status update and the inserts.
+        """
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                UPDATE report_history 
-                SET sent_at = CURRENT_TIMESTAMP, 
-                    sent_to = ?,
+                UPDATE report_history
+                SET sent_at = CURRENT_TIMESTAMP,
                     status = 'sent'
                 WHERE id = ?
-            """, (json.dumps(sent_to), report_id))
+            """, (report_id,))
+            cursor.execute(
+                "DELETE FROM report_recipients WHERE report_id = ?", (report_id,)
+            )
+            cursor.executemany(
+                "INSERT INTO report_recipients (report_id, email) VALUES (?, ?)",
+                [(report_id, email) for email in sent_to],
+            )
     
     @classmethod
     def get_recent(cls, limit: int = 20) -> list[dict]:
         """Get recent report history."""
-        with get_connection() as conn:
+        with read_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute("""
-                SELECT id, filename, date_range, generated_at, sent_at, sent_to, status
-                FROM report_history
-                ORDER BY generated_at DESC
+                SELECT h.id, h.filename, h.date_range, h.generated_at,
+                       h.sent_at, h.sent_to, h.status,
+                       GROUP_CONCAT(r.email) AS recipient_emails
+                FROM report_history h
+                LEFT JOIN report_recipients r ON r.report_id = h.id
+                GROUP BY h.id
+                ORDER BY h.generated_at DESC
                 LIMIT ?
             """, (limit,))
-            
+
+            cols = [c[0] for c in cursor.description]
             results = []
             for row in cursor.fetchall():
-                item = dict(row)
-                if item["sent_to"]:
+                item = dict(zip(cols, row))
+                emails = item.pop("recipient_emails")
+                if emails:
+                    item["sent_to"] = emails.split(",")
+                elif item["sent_to"]:
+                    # Legacy rows written before the child table existed
                     item["sent_to"] = json.loads(item["sent_to"])
                 results.append(item)
-            
+
             return results
 
 
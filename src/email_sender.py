@@ -2,8 +2,11 @@
 Email sender for sending weekly reports to recipients.
 """
 
+import html
+import re
 import smtplib
 import ssl
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dataclasses import dataclass
@@ -43,9 +46,37 @@ class EmailSender:
         },
     }
 
+    # Precompiled patterns for _text_to_html so the conversion is a few
+    # C-level regex passes instead of Python branches on every line.
+    # They run after html.escape, hence the &amp; in the category names
+    # (the old per-line comparison missed "Code & Infrastructure" for
+    # exactly that reason).
+    _SECTION_RE = re.compile(r"(?m)^[1-5]\. .*$")
+    # [ \t] rather than \s: under (?m), \s would also match newlines and
+    # pull adjacent blank lines into the bolded header.
+    _CATEGORY_RE = re.compile(
+        r"(?m)^[ \t]*(?:Feature Development|Code &amp; Infrastructure|Bug Fixes|"
+        r"Documentation|New Team Member Onboarding)[ \t]*$"
+    )
+    _BULLET_RE = re.compile(r"(?m)^([ \t]*)[*-] ")
+
+    # One SSL context for all senders; create_default_context() parses
+    # the whole system CA bundle, so don't redo that per connection.
+    _SSL_CTX = ssl.create_default_context()
+
+    # Very large recipient lists are split into envelopes of this many
+    # addresses, all sent over the same authenticated connection
+    MAX_RCPT_PER_SEND = 50
+
     def __init__(self, config: EmailConfig):
         """Initialize the email sender."""
         self.config = config
+        self._server: Optional[smtplib.SMTP] = None
+        # smtplib.SMTP is not thread-safe, and a cached sender can be
+        # invoked from several worker threads at once; serialize all use
+        # of the shared connection. Reentrant because a failed send
+        # calls close() while the lock is held.
+        self._lock = threading.RLock()
 
     @classmethod
     def from_provider(cls, provider: str, username: str, password: str) -> "EmailSender":
@@ -70,6 +101,51 @@ class EmailSender:
         )
         return cls(config)
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open a fresh SMTP connection and authenticate."""
+        if self.config.use_tls:
+            server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+            server.starttls(context=self._SSL_CTX)
+        else:
+            server = smtplib.SMTP_SSL(
+                self.config.smtp_server,
+                self.config.smtp_port,
+                context=self._SSL_CTX
+            )
+        server.login(self.config.username, self.config.password)
+        return server
+
+    def _get_server(self) -> smtplib.SMTP:
+        """Reuse the open SMTP connection, reconnecting if it went stale.
+
+        Keeping the connection alive across calls skips the TCP + TLS +
+        AUTH handshake (~1s) on every send after the first.
+        """
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPServerDisconnected, OSError):
+                self._server = None
+        self._server = self._connect()
+        return self._server
+
+    def close(self):
+        """Close the SMTP connection if one is open."""
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except Exception:
+                    pass
+                self._server = None
+
+    def __enter__(self) -> "EmailSender":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def send_report(
         self,
         subject: str,
@@ -78,10 +154,11 @@ class EmailSender:
         to_emails: list[str],
         cc_emails: list[str] = None,
         from_name: str = None,
+        html: bool = True,
     ) -> bool:
         """
         Send the weekly report via email.
-        
+
         Args:
             subject: Email subject
             body: Email body (plain text)
@@ -89,58 +166,52 @@ class EmailSender:
             to_emails: List of recipient email addresses
             cc_emails: List of CC email addresses
             from_name: Display name for sender
-            
+            html: Also attach an HTML version of the body
+
         Returns:
             True if email was sent successfully
         """
         if cc_emails is None:
             cc_emails = []
 
-        # Create message
-        msg = MIMEMultipart("alternative")
-        
+        # Create message; plain-text only unless the HTML part is wanted,
+        # which skips the escape/convert pass over the whole report
+        if html:
+            msg = MIMEMultipart("alternative")
+            msg.attach(MIMEText(body, "plain"))
+            msg.attach(MIMEText(self._text_to_html(body), "html"))
+        else:
+            msg = MIMEText(body, "plain")
+
         # Set headers
         if from_name:
             msg["From"] = f"{from_name} <{from_email}>"
         else:
             msg["From"] = from_email
-        
+
         msg["To"] = ", ".join(to_emails)
         if cc_emails:
             msg["Cc"] = ", ".join(cc_emails)
         msg["Subject"] = subject
 
-        # Add plain text body
-        text_part = MIMEText(body, "plain")
-        msg.attach(text_part)
-
-        # Also add HTML version for better formatting
-        html_body = self._text_to_html(body)
-        html_part = MIMEText(html_body, "html")
-        msg.attach(html_part)
-
         # All recipients (to + cc)
         all_recipients = to_emails + cc_emails
 
         try:
-            # Connect to SMTP server
-            if self.config.use_tls:
-                server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
-                server.starttls(context=ssl.create_default_context())
-            else:
-                server = smtplib.SMTP_SSL(
-                    self.config.smtp_server, 
-                    self.config.smtp_port,
-                    context=ssl.create_default_context()
-                )
-
-            # Login and send
-            server.login(self.config.username, self.config.password)
-            server.sendmail(from_email, all_recipients, msg.as_string())
-            server.quit()
-            
+            # Send over the persistent (or freshly opened) connection.
+            # send_message streams the message to the socket instead of
+            # materializing msg.as_string() first.
+            with self._lock:
+                server = self._get_server()
+                for i in range(0, len(all_recipients), self.MAX_RCPT_PER_SEND):
+                    server.send_message(
+                        msg,
+                        from_addr=from_email,
+                        to_addrs=all_recipients[i:i + self.MAX_RCPT_PER_SEND],
+                    )
+
             return True
-            
+
         except smtplib.SMTPAuthenticationError as e:
             print(f"Authentication failed: {e}")
             print("\nFor Gmail, you need to use an App Password:")
@@ -150,37 +221,20 @@ class EmailSender:
             return False
         except Exception as e:
             print(f"Failed to send email: {e}")
+            self.close()  # drop the connection; the next send reconnects
             return False
 
     def _text_to_html(self, text: str) -> str:
         """Convert plain text report to HTML for better email formatting."""
-        import html
-        
-        # Escape HTML characters
+        # Escape HTML characters, then bold headers and convert bullets
+        # with whole-document regex substitutions
         escaped = html.escape(text)
-        
-        # Convert sections to bold
-        lines = escaped.split("\n")
-        html_lines = []
-        
-        for line in lines:
-            # Make section headers bold
-            if line.startswith("1. ") or line.startswith("2. ") or \
-               line.startswith("3. ") or line.startswith("4. ") or \
-               line.startswith("5. "):
-                line = f"<strong>{line}</strong>"
-            # Make category headers bold
-            elif line.strip() in ["Feature Development", "Code & Infrastructure", 
-                                  "Bug Fixes", "Documentation", "New Team Member Onboarding"]:
-                line = f"<strong>{line}</strong>"
-            # Convert bullet points
-            elif line.strip().startswith("* ") or line.strip().startswith("- "):
-                line = line.replace("* ", "• ", 1).replace("- ", "• ", 1)
-            
-            html_lines.append(line)
-        
+        escaped = self._SECTION_RE.sub(r"<strong>\g<0></strong>", escaped)
+        escaped = self._CATEGORY_RE.sub(r"<strong>\g<0></strong>", escaped)
+        escaped = self._BULLET_RE.sub("\\1• ", escaped)
+
         # Join with <br> tags
-        html_body = "<br>\n".join(html_lines)
+        html_body = escaped.replace("\n", "<br>\n")
         
         # Wrap in basic HTML
         return f"""<!DOCTYPE html>
@@ -202,20 +256,10 @@ class EmailSender:
 </html>"""
 
     def test_connection(self) -> bool:
-        """Test the SMTP connection."""
+        """Test the SMTP connection (and keep it open for a following send)."""
         try:
-            if self.config.use_tls:
-                server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
-                server.starttls(context=ssl.create_default_context())
-            else:
-                server = smtplib.SMTP_SSL(
-                    self.config.smtp_server,
-                    self.config.smtp_port,
-                    context=ssl.create_default_context()
-                )
-            
-            server.login(self.config.username, self.config.password)
-            server.quit()
+            with self._lock:
+                self._get_server()
             return True
         except Exception as e:
             print(f"Connection test failed: {e}")
@@ -250,14 +294,14 @@ def send_report_email(
     Returns:
         True if sent successfully
     """
-    # Read report file
-    report_path = Path(report_file)
-    if not report_path.exists():
+    # Read report file; read_bytes + one decode skips the stat() of an
+    # exists() pre-check and text-mode newline translation
+    try:
+        body = Path(report_file).read_bytes().decode("utf-8")
+    except FileNotFoundError:
         print(f"Report file not found: {report_file}")
         return False
     
-    body = report_path.read_text()
-    
     # Generate subject if not provided
     if subject is None:
         from datetime import datetime
@@ -2,7 +2,10 @@
 Parser for extracting status updates from Slack messages.
 """
 
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Optional
@@ -10,6 +13,12 @@ from enum import Enum
 
 from .slack_client import SlackMessage
 
+try:
+    # Optional: multi-pattern keyword matching in one pass over the text
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class TaskStatus(Enum):
     """Status of a task."""
@@ -79,21 +88,56 @@ class MessageParser:
     # Pattern to extract assignee (e.g., @Binh Huynh, @rogerio)
     ASSIGNEE_PATTERN = r"@([A-Za-z]+(?:\s+[A-Za-z]+)?)"
 
+    # Keywords that suggest a message is a structured status update
+    SECTION_KEYWORDS = ("done", "completed", "in progress", "working on",
+                        "blocked", "next", "planned", "today", "yesterday")
+
+    # Compiled patterns, built once per process and shared by all instances
+    _compiled_cache = None
+
     def __init__(self):
         """Initialize the parser."""
         self._compile_patterns()
 
     def _compile_patterns(self):
-        """Compile regex patterns for efficiency."""
-        self.compiled_sections = {}
-        for section, patterns in self.SECTION_PATTERNS.items():
-            self.compiled_sections[section] = [
-                re.compile(p, re.IGNORECASE) for p in patterns
-            ]
-        
-        self.ticket_re = re.compile(self.TICKET_PATTERN)
-        self.pr_re = re.compile(self.PR_PATTERN)
-        self.assignee_re = re.compile(self.ASSIGNEE_PATTERN)
+        """Compile regex patterns for efficiency (once per process)."""
+        cls = MessageParser
+        if cls._compiled_cache is None:
+            # Merge every header pattern into one named-group alternation so
+            # a message is split into sections in a single regex sweep
+            # instead of trying each pattern against each line.
+            header_alternation = "|".join(
+                f"(?P<{section}>{'|'.join(patterns)})"
+                for section, patterns in cls.SECTION_PATTERNS.items()
+            )
+            header_re = re.compile(
+                rf"^[ \t]*(?:{header_alternation})",
+                re.IGNORECASE | re.MULTILINE,
+            )
+            # Aho-Corasick automaton for the section keywords: one O(N)
+            # walk over the text instead of one substring scan per keyword.
+            # None when the optional pyahocorasick package is missing.
+            keyword_ac = None
+            if ahocorasick is not None:
+                keyword_ac = ahocorasick.Automaton()
+                for keyword in cls.SECTION_KEYWORDS:
+                    keyword_ac.add_word(keyword, keyword)
+                keyword_ac.make_automaton()
+
+            cls._compiled_cache = (
+                header_re,
+                re.compile(cls.TICKET_PATTERN),
+                re.compile(cls.PR_PATTERN),
+                re.compile(cls.ASSIGNEE_PATTERN),
+                re.compile(r"(?:^|\n)\s*[-•*\d.]\s+"),
+                re.compile(r"(?:^|\n)\s*[-•*]\s*|(?:^|\n)\s*\d+\.\s*"),
+                re.compile(r"\s*[-–—]\s*$"),
+                keyword_ac,
+            )
+
+        (self.header_re, self.ticket_re,
+         self.pr_re, self.assignee_re, self.list_re,
+         self.split_re, self.trail_re, self.keyword_ac) = cls._compiled_cache
 
     def is_status_update(self, message: SlackMessage) -> bool:
         """
@@ -106,24 +150,40 @@ class MessageParser:
         - Has reasonable length (not too short)
         """
         text = message.text.lower()
-        
-        # Check for section headers
-        section_keywords = ["done", "completed", "in progress", "working on", 
-                          "blocked", "next", "planned", "today", "yesterday"]
-        has_sections = sum(1 for kw in section_keywords if kw in text) >= 2
-        
+
+        # Cheapest heuristic first; every later check stops as soon as
+        # the score can no longer change the verdict
+        score = 1 if len(message.text) > 100 else 0
+
+        # Check for section headers: count distinct keywords present,
+        # in a single automaton pass when pyahocorasick is installed
+        found = 0
+        if self.keyword_ac is not None:
+            seen = set()
+            for _, kw in self.keyword_ac.iter(text):
+                seen.add(kw)
+                if len(seen) >= 2:
+                    break
+            found = len(seen)
+        else:
+            for kw in self.SECTION_KEYWORDS:
+                if kw in text:
+                    found += 1
+                    if found >= 2:
+                        break
+        if found >= 2:
+            score += 1
+            if score >= 2:
+                return True
+
         # Check for list indicators
-        has_lists = bool(re.search(r"(?:^|\n)\s*[-•*\d.]\s+", message.text))
-        
-        # Check for ticket IDs
-        has_tickets = bool(self.ticket_re.search(message.text))
-        
-        # Check minimum length
-        has_length = len(message.text) > 100
+        if self.list_re.search(message.text):
+            score += 1
+            if score >= 2:
+                return True
 
-        # Score the message
-        score = sum([has_sections, has_lists, has_tickets, has_length])
-        return score >= 2
+        # Check for ticket IDs
+        return score == 1 and bool(self.ticket_re.search(message.text))
 
     def parse_message(self, message: SlackMessage) -> Optional[DailyStatus]:
         """
@@ -162,48 +222,33 @@ class MessageParser:
         return status
 
     def _split_into_sections(self, text: str) -> dict[str, str]:
-        """Split message text into sections based on headers."""
+        """Split message text into sections with one header-regex sweep."""
         sections = {}
-        lines = text.split("\n")
-        
-        current_section = None
-        current_content = []
+        matches = list(self.header_re.finditer(text))
 
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Check if this line is a section header
-            detected_section = None
-            for section_type, patterns in self.compiled_sections.items():
-                for pattern in patterns:
-                    if pattern.match(line_lower):
-                        detected_section = section_type
-                        break
-                if detected_section:
-                    break
+        for i, match in enumerate(matches):
+            # Content starts after the header line and runs to the next header
+            line_end = text.find("\n", match.start())
+            start = len(text) if line_end == -1 else line_end + 1
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
 
-            if detected_section:
-                # Save previous section
-                if current_section and current_content:
-                    sections[current_section] = "\n".join(current_content)
-                
-                current_section = detected_section
-                current_content = []
-            elif current_section:
-                current_content.append(line)
-
-        # Save last section
-        if current_section and current_content:
-            sections[current_section] = "\n".join(current_content)
+            content = text[start:end].strip("\n")
+            if content:
+                sections[match.lastgroup] = content
 
         return sections
 
     def _parse_tasks(self, content: str, default_assignee: str) -> list[Task]:
         """Parse tasks from section content."""
         tasks = []
-        
-        # Split by bullet points or numbered lists
-        items = re.split(r"(?:^|\n)\s*[-•*]\s*|\n\s*\d+\.\s*", content)
+
+        # Split by bullet points or numbered lists. Without any bullet
+        # marker or a "." (needed by the numbered-list branch) the
+        # splitter cannot match, so skip the regex engine entirely.
+        if any(ch in content for ch in "-•*."):
+            items = self.split_re.split(content)
+        else:
+            items = [content]
         
         for item in items:
             item = item.strip()
@@ -218,16 +263,20 @@ class MessageParser:
             pr_match = self.pr_re.search(item)
             pr_number = pr_match.group(1) if pr_match else None
 
-            # Extract assignee
+            # Extract assignee; interned because assignees become dict
+            # keys in aggregation, where interned strings hash once and
+            # compare by pointer
             assignee_match = self.assignee_re.search(item)
-            assignee = assignee_match.group(1) if assignee_match else default_assignee
+            assignee = sys.intern(
+                assignee_match.group(1) if assignee_match else default_assignee
+            )
 
             # Clean description
             description = item
             # Remove assignee mention from description
             description = self.assignee_re.sub("", description).strip()
             # Clean up trailing dashes or hyphens
-            description = re.sub(r"\s*[-–—]\s*$", "", description).strip()
+            description = self.trail_re.sub("", description).strip()
 
             if description:
                 tasks.append(Task(
@@ -240,22 +289,59 @@ class MessageParser:
 
         return tasks
 
-    def parse_messages(self, messages: list[SlackMessage]) -> list[DailyStatus]:
+    def parse_messages(
+        self,
+        messages: list[SlackMessage],
+        workers: int = None,
+    ) -> list[DailyStatus]:
         """
         Parse multiple messages and return status updates.
-        
+
+        Parsing is CPU-bound and every message is independent, so large
+        batches are spread over a process pool; small batches stay on
+        the serial path to avoid the worker start-up cost.
+
         Args:
             messages: List of Slack messages
-            
+            workers: Process count; defaults to one worker per ~50
+                messages (capped at the CPU count), serial below 100
+
         Returns:
             List of parsed DailyStatus objects
         """
-        statuses = []
-        for msg in messages:
-            status = self.parse_message(msg)
-            if status:
-                statuses.append(status)
-        return statuses
+        if workers is None:
+            if len(messages) <= 100:
+                workers = 1
+            else:
+                workers = min(os.cpu_count() or 1, len(messages) // 50)
+
+        if workers <= 1:
+            statuses = []
+            for msg in messages:
+                status = self.parse_message(msg)
+                if status:
+                    statuses.append(status)
+            return statuses
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [
+                status
+                for status in executor.map(self.parse_message, messages, chunksize=32)
+                if status
+            ]
+
+
+# Shared parser instance; the compiled patterns are immutable after
+# construction, so one parser can serve every consumer in the process
+_parser_singleton: Optional[MessageParser] = None
+
+
+def get_parser() -> MessageParser:
+    """Return the process-wide MessageParser, creating it on first use."""
+    global _parser_singleton
+    if _parser_singleton is None:
+        _parser_singleton = MessageParser()
+    return _parser_singleton
 
 
 class StatusAggregator:
@@ -263,7 +349,7 @@ class StatusAggregator:
 
     def __init__(self):
         """Initialize the aggregator."""
-        self.parser = MessageParser()
+        self.parser = get_parser()
 
     def aggregate(self, statuses: list[DailyStatus]) -> dict:
         """
@@ -279,8 +365,10 @@ class StatusAggregator:
             "done": {},  # assignee -> list of tasks
             "in_progress": {},
             "planned": {},
-            "blockers": [],
-            "notes": [],
+            # dicts so extend-time updates dedup incrementally while
+            # keeping first-seen order; converted to lists at return
+            "blockers": {},
+            "notes": {},
             "authors": set(),
             "date_range": {
                 "start": None,
@@ -288,45 +376,38 @@ class StatusAggregator:
             }
         }
 
+        # Date range tracked in locals; written back once after the loop
+        start = end = None
+
         for status in statuses:
             aggregated["authors"].add(status.author)
-            
+
             # Track date range
-            if aggregated["date_range"]["start"] is None:
-                aggregated["date_range"]["start"] = status.date
-            else:
-                aggregated["date_range"]["start"] = min(
-                    aggregated["date_range"]["start"], status.date
-                )
-            
-            if aggregated["date_range"]["end"] is None:
-                aggregated["date_range"]["end"] = status.date
-            else:
-                aggregated["date_range"]["end"] = max(
-                    aggregated["date_range"]["end"], status.date
-                )
+            if start is None or status.date < start:
+                start = status.date
+            if end is None or status.date > end:
+                end = status.date
 
             # Aggregate tasks by assignee
-            for task in status.done:
-                if task.assignee not in aggregated["done"]:
-                    aggregated["done"][task.assignee] = []
-                aggregated["done"][task.assignee].append(task)
-
-            for task in status.in_progress:
-                if task.assignee not in aggregated["in_progress"]:
-                    aggregated["in_progress"][task.assignee] = []
-                aggregated["in_progress"][task.assignee].append(task)
+            for category, tasks in (
+                ("done", status.done),
+                ("in_progress", status.in_progress),
+                ("planned", status.planned),
+            ):
+                bucket = aggregated[category]
+                for task in tasks:
+                    bucket.setdefault(task.assignee, []).append(task)
 
-            for task in status.planned:
-                if task.assignee not in aggregated["planned"]:
-                    aggregated["planned"][task.assignee] = []
-                aggregated["planned"][task.assignee].append(task)
+            aggregated["blockers"].update(dict.fromkeys(status.blockers))
+            aggregated["notes"].update(dict.fromkeys(status.notes))
 
-            aggregated["blockers"].extend(status.blockers)
-            aggregated["notes"].extend(status.notes)
+        aggregated["date_range"]["start"] = start
+        aggregated["date_range"]["end"] = end
 
-        # Convert authors set to list
+        # Convert authors set to list, blocker/note dicts to lists
         aggregated["authors"] = list(aggregated["authors"])
+        aggregated["blockers"] = list(aggregated["blockers"])
+        aggregated["notes"] = list(aggregated["notes"])
         
         # Deduplicate tasks (same ticket or similar description)
         aggregated = self._deduplicate_tasks(aggregated)
@@ -337,27 +418,17 @@ class StatusAggregator:
         """Remove duplicate tasks based on ticket ID or similar descriptions."""
         for category in ["done", "in_progress", "planned"]:
             for assignee, tasks in aggregated[category].items():
-                seen_tickets = set()
-                seen_descriptions = set()
-                unique_tasks = []
-                
+                # One dict keyed by ticket ID (or normalized description
+                # for unticketed tasks); setdefault keeps the first task
+                # seen per key, in insertion order
+                unique = {}
                 for task in tasks:
-                    # Check by ticket ID first
                     if task.ticket_id:
-                        if task.ticket_id not in seen_tickets:
-                            seen_tickets.add(task.ticket_id)
-                            unique_tasks.append(task)
+                        key = ("ticket", task.ticket_id)
                     else:
-                        # Normalize description for comparison
-                        normalized = task.description.lower().strip()[:50]
-                        if normalized not in seen_descriptions:
-                            seen_descriptions.add(normalized)
-                            unique_tasks.append(task)
-                
-                aggregated[category][assignee] = unique_tasks
-
-        # Deduplicate blockers
-        aggregated["blockers"] = list(set(aggregated["blockers"]))
-        aggregated["notes"] = list(set(aggregated["notes"]))
+                        key = ("desc", task.description.lower().strip()[:50])
+                    unique.setdefault(key, task)
+
+                aggregated[category][assignee] = list(unique.values())
 
         return aggregated
@@ -2,12 +2,21 @@
 Report generator that creates weekly summary reports from aggregated status data.
 """
 
+import hashlib
+import os
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Optional
 from dataclasses import dataclass
 
 from .message_parser import DailyStatus, StatusAggregator, Task
 
+try:
+    # Optional: multi-pattern keyword matching in one pass over the text
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 @dataclass
 class ReportSection:
@@ -28,8 +37,36 @@ class ReportGenerator:
     5. QUESTIONS/BLOCKERS
     """
 
+    # Keywords for categorization; dict order is the category priority
+    # (a task matching several categories lands in the first one)
+    CATEGORY_KEYWORDS = {
+        "Feature Development": [
+            "feature", "implement", "add", "create", "build", "develop",
+            "show", "display", "handle", "print", "export", "v2-", "v1-"
+        ],
+        "Bug Fixes": [
+            "fix", "bug", "issue", "error", "patch", "resolve", "correct"
+        ],
+        "Code & Infrastructure": [
+            "refactor", "clean", "remove", "update", "deploy", "infrastructure",
+            "database", "api", "config", "setup", "pr", "code review",
+            "swagger", "postman", "dump", "migration"
+        ],
+        "Documentation": [
+            "doc", "readme", "comment", "guide", "tutorial", "overview"
+        ],
+        "New Team Member Onboarding": [
+            "onboard", "setup", "environment", "local", "new team", "welcome",
+            "training", "overview session", "familiarization"
+        ],
+    }
+
+    # Keyword automaton mapping each keyword to (priority, category),
+    # built once per process; None when pyahocorasick is missing
+    _category_ac = None
+
     def __init__(
-        self, 
+        self,
         sender_name: str = "Report Generator",
         sender_email: str = "",
         recipients_to: list[str] = None,
@@ -41,6 +78,22 @@ class ReportGenerator:
         self.recipients_to = recipients_to or []
         self.recipients_cc = recipients_cc or []
         self.aggregator = StatusAggregator()
+        self._build_category_automaton()
+
+    @classmethod
+    def _build_category_automaton(cls):
+        """Build the shared keyword automaton on first use."""
+        if ahocorasick is None or cls._category_ac is not None:
+            return
+        automaton = ahocorasick.Automaton()
+        for priority, (category, keywords) in enumerate(cls.CATEGORY_KEYWORDS.items()):
+            for keyword in keywords:
+                # add_word keeps the first value for duplicate keywords
+                # (e.g. "setup"), which matches category priority
+                if not automaton.exists(keyword):
+                    automaton.add_word(keyword, (priority, category))
+        automaton.make_automaton()
+        cls._category_ac = automaton
 
     def generate(
         self,
@@ -60,37 +113,45 @@ class ReportGenerator:
         if not statuses:
             return self._generate_empty_report()
 
-        # Aggregate all statuses
+        # Every section appends lines to one shared list so the whole
+        # report is materialized by a single join
         aggregated = self.aggregator.aggregate(statuses)
-        
-        # Generate report sections
-        report_parts = []
-        
-        # Header
-        report_parts.append(self._generate_header(aggregated))
-        
-        # 1. NOTES
-        report_parts.append(self._generate_notes_section(aggregated, notes))
-        
-        # 2. DONE
-        report_parts.append(self._generate_done_section(aggregated))
-        
-        # 3. IN PROGRESS
-        report_parts.append(self._generate_in_progress_section(aggregated))
-        
-        # 4. NEXT PLAN
-        report_parts.append(self._generate_next_plan_section(aggregated))
-        
-        # 5. QUESTIONS/BLOCKERS
-        report_parts.append(self._generate_blockers_section(aggregated))
-        
-        # Footer
-        report_parts.append(self._generate_footer())
-        
-        return "\n".join(filter(None, report_parts))
+        lines: list[str] = []
+        for emit in self._section_emitters(aggregated, notes):
+            emit(lines)
+        return "\n".join(lines)
 
-    def _generate_header(self, aggregated: dict) -> str:
-        """Generate the report header."""
+    def iter_sections(self, statuses: list[DailyStatus], notes: list[str] = None):
+        """
+        Yield the report one section at a time.
+
+        Lets callers stream the report straight to disk without holding
+        the whole string in memory; generate() flattens the same lines.
+        """
+        if not statuses:
+            yield self._generate_empty_report()
+            return
+
+        aggregated = self.aggregator.aggregate(statuses)
+        for emit in self._section_emitters(aggregated, notes):
+            lines: list[str] = []
+            emit(lines)
+            yield "\n".join(lines)
+
+    def _section_emitters(self, aggregated: dict, notes: list[str] = None):
+        """Return the report sections as line emitters, in report order."""
+        return (
+            lambda out: self._emit_header(aggregated, out),
+            lambda out: self._emit_notes_section(aggregated, out, notes),
+            lambda out: self._emit_done_section(aggregated, out),
+            lambda out: self._emit_in_progress_section(aggregated, out),
+            lambda out: self._emit_next_plan_section(aggregated, out),
+            lambda out: self._emit_blockers_section(aggregated, out),
+            self._emit_footer,
+        )
+
+    def _emit_header(self, aggregated: dict, out: list[str]):
+        """Emit the report header."""
         now = datetime.now()
         
         # Format date range
@@ -109,19 +170,17 @@ class ReportGenerator:
         else:
             sender_line = self.sender_name
         
-        lines = [
-            sender_line,
-            now.strftime("%b %d, %Y, %I:%M %p"),
-        ]
-        
+        out.append(sender_line)
+        out.append(now.strftime("%b %d, %Y, %I:%M %p"))
+
         # Add recipients
         if self.recipients_to:
-            lines.append(f"to: {', '.join(self.recipients_to)}")
-        
+            out.append(f"to: {', '.join(self.recipients_to)}")
+
         if self.recipients_cc:
-            lines.append(f"cc: {', '.join(self.recipients_cc)}")
-        
-        lines.extend([
+            out.append(f"cc: {', '.join(self.recipients_cc)}")
+
+        out.extend([
             "",
             "Hi all,",
             "",
@@ -130,113 +189,104 @@ class ReportGenerator:
             f"Please find below the End of Week Update covering the period from {date_range}:",
             "",
         ])
-        
-        return "\n".join(lines)
 
-    def _generate_notes_section(
-        self, 
-        aggregated: dict, 
-        additional_notes: list[str] = None
-    ) -> str:
-        """Generate the NOTES section."""
-        lines = ["1. NOTES"]
-        
+    def _emit_notes_section(
+        self,
+        aggregated: dict,
+        out: list[str],
+        additional_notes: list[str] = None,
+    ):
+        """Emit the NOTES section."""
+        out.append("1. NOTES")
+
         notes = aggregated.get("notes", [])
         if additional_notes:
             notes.extend(additional_notes)
-        
+
         if notes:
             for note in notes:
-                lines.append(f"- {note}")
+                out.append(f"- {note}")
         else:
-            lines.append("- No special notes this week")
-        
-        lines.append("")
-        return "\n".join(lines)
+            out.append("- No special notes this week")
+
+        out.append("")
+
+    def _emit_done_section(self, aggregated: dict, out: list[str]):
+        """Emit the DONE section grouped by category/assignee."""
+        out.append("2. DONE")
 
-    def _generate_done_section(self, aggregated: dict) -> str:
-        """Generate the DONE section grouped by category/assignee."""
-        lines = ["2. DONE"]
-        
         done_tasks = aggregated.get("done", {})
-        
+
         if not done_tasks:
-            lines.append("- No completed tasks this week")
-            lines.append("")
-            return "\n".join(lines)
-        
+            out.append("- No completed tasks this week")
+            out.append("")
+            return
+
         # Group tasks by category (inferred from ticket patterns or descriptions)
         categorized = self._categorize_tasks(done_tasks)
-        
+
         for category, tasks_by_assignee in categorized.items():
             if tasks_by_assignee:
-                lines.append(f"\n{category}")
-                lines.append("")
-                
+                out.append(f"\n{category}")
+                out.append("")
+
                 for assignee, tasks in tasks_by_assignee.items():
                     for task in tasks:
-                        task_line = self._format_task(task)
-                        lines.append(task_line)
-        
-        lines.append("")
-        return "\n".join(lines)
+                        out.append(self._format_task(task))
+
+        out.append("")
+
+    def _emit_in_progress_section(self, aggregated: dict, out: list[str]):
+        """Emit the IN PROGRESS section."""
+        out.append("3. IN PROGRESS")
 
-    def _generate_in_progress_section(self, aggregated: dict) -> str:
-        """Generate the IN PROGRESS section."""
-        lines = ["3. IN PROGRESS"]
-        
         in_progress = aggregated.get("in_progress", {})
-        
+
         if not in_progress:
-            lines.append("- No tasks currently in progress")
-            lines.append("")
-            return "\n".join(lines)
-        
+            out.append("- No tasks currently in progress")
+            out.append("")
+            return
+
         for assignee, tasks in in_progress.items():
             for task in tasks:
-                task_line = self._format_task(task)
-                lines.append(task_line)
-        
-        lines.append("")
-        return "\n".join(lines)
+                out.append(self._format_task(task))
+
+        out.append("")
+
+    def _emit_next_plan_section(self, aggregated: dict, out: list[str]):
+        """Emit the NEXT PLAN section."""
+        out.append("4. NEXT PLAN")
 
-    def _generate_next_plan_section(self, aggregated: dict) -> str:
-        """Generate the NEXT PLAN section."""
-        lines = ["4. NEXT PLAN"]
-        
         planned = aggregated.get("planned", {})
-        
+
         if not planned:
-            lines.append("- Planning to continue with assigned tasks")
-            lines.append("")
-            return "\n".join(lines)
-        
+            out.append("- Planning to continue with assigned tasks")
+            out.append("")
+            return
+
         for assignee, tasks in planned.items():
             for task in tasks:
-                task_line = self._format_task(task)
-                lines.append(task_line)
-        
-        lines.append("")
-        return "\n".join(lines)
+                out.append(self._format_task(task))
+
+        out.append("")
+
+    def _emit_blockers_section(self, aggregated: dict, out: list[str]):
+        """Emit the QUESTIONS/BLOCKERS section."""
+        out.append("5. QUESTIONS/BLOCKERS")
 
-    def _generate_blockers_section(self, aggregated: dict) -> str:
-        """Generate the QUESTIONS/BLOCKERS section."""
-        lines = ["5. QUESTIONS/BLOCKERS"]
-        
         blockers = aggregated.get("blockers", [])
-        
+
         if not blockers:
-            lines.append("- No blockers this week")
+            out.append("- No blockers this week")
         else:
             for blocker in blockers:
-                lines.append(f"- {blocker}")
-        
-        lines.append("")
-        return "\n".join(lines)
+                out.append(f"- {blocker}")
+
+        out.append("")
 
-    def _generate_footer(self) -> str:
-        """Generate the report footer."""
-        return "\n".join([
+    def _emit_footer(self, out: list[str]):
+        """Emit the report footer."""
+        out.extend([
             "Please let us know if you have any questions or concerns.",
             "",
             "Thanks and Best regards,",
@@ -255,23 +305,14 @@ Generated on: {now.strftime('%B %d, %Y at %I:%M %p')}
 
     def _format_task(self, task: Task) -> str:
         """Format a single task for display."""
-        parts = []
-        
-        # Add ticket ID if present
-        if task.ticket_id:
-            parts.append(f"{task.ticket_id}:")
-        
-        # Add description
-        parts.append(task.description)
-        
-        # Add PR reference if present
-        if task.pr_number:
-            parts.append(f"- PR #{task.pr_number}")
-        
-        # Add assignee
-        parts.append(f"- @{task.assignee}")
-        
-        return " ".join(parts)
+        # Single f-string: ticket and PR fall away when absent, no
+        # intermediate parts list to build and join per task
+        return (
+            f"{task.ticket_id + ': ' if task.ticket_id else ''}"
+            f"{task.description}"
+            f"{' - PR #' + task.pr_number if task.pr_number else ''}"
+            f" - @{task.assignee}"
+        )
 
     def _categorize_tasks(self, tasks_by_assignee: dict) -> dict:
         """
@@ -285,63 +326,37 @@ Generated on: {now.strftime('%B %d, %Y at %I:%M %p')}
         - Onboarding
         - Other
         """
-        categories = {
-            "Feature Development": {},
-            "Bug Fixes": {},
-            "Code & Infrastructure": {},
-            "Documentation": {},
-            "New Team Member Onboarding": {},
-            "Other": {},
-        }
-        
-        # Keywords for categorization
-        category_keywords = {
-            "Feature Development": [
-                "feature", "implement", "add", "create", "build", "develop",
-                "show", "display", "handle", "print", "export", "v2-", "v1-"
-            ],
-            "Bug Fixes": [
-                "fix", "bug", "issue", "error", "patch", "resolve", "correct"
-            ],
-            "Code & Infrastructure": [
-                "refactor", "clean", "remove", "update", "deploy", "infrastructure",
-                "database", "api", "config", "setup", "pr", "code review",
-                "swagger", "postman", "dump", "migration"
-            ],
-            "Documentation": [
-                "doc", "readme", "comment", "guide", "tutorial", "overview"
-            ],
-            "New Team Member Onboarding": [
-                "onboard", "setup", "environment", "local", "new team", "welcome",
-                "training", "overview session", "familiarization"
-            ],
-        }
-        
+        categories = {name: {} for name in self.CATEGORY_KEYWORDS}
+        categories["Other"] = {}
+
         for assignee, tasks in tasks_by_assignee.items():
             for task in tasks:
-                description_lower = task.description.lower()
-                ticket_lower = (task.ticket_id or "").lower()
-                
-                categorized = False
-                for category, keywords in category_keywords.items():
-                    for keyword in keywords:
-                        if keyword in description_lower or keyword in ticket_lower:
-                            if assignee not in categories[category]:
-                                categories[category][assignee] = []
-                            categories[category][assignee].append(task)
-                            categorized = True
-                            break
-                    if categorized:
-                        break
-                
-                if not categorized:
-                    if assignee not in categories["Other"]:
-                        categories["Other"][assignee] = []
-                    categories["Other"][assignee].append(task)
+                # Newline joint so no keyword can straddle the boundary
+                haystack = task.description.lower()
+                if task.ticket_id:
+                    haystack += "\n" + task.ticket_id.lower()
+
+                category = self._match_category(haystack)
+                categories[category].setdefault(assignee, []).append(task)
         
         # Remove empty categories
         return {k: v for k, v in categories.items() if v}
 
+    def _match_category(self, haystack: str) -> str:
+        """Return the highest-priority category with a keyword in haystack."""
+        if self._category_ac is not None:
+            # One automaton walk yields every keyword hit; take the best
+            best = min(
+                (value for _, value in self._category_ac.iter(haystack)),
+                default=None,
+            )
+            return best[1] if best else "Other"
+
+        for category, keywords in self.CATEGORY_KEYWORDS.items():
+            if any(kw in haystack for kw in keywords):
+                return category
+        return "Other"
+
 
 class GroqReportEnhancer:
     """
@@ -377,28 +392,85 @@ Please let us know if you have any questions or concerns.
 
 Thanks and Best regards,"""
 
+    # On-disk cache of model responses keyed by prompt hash, mirroring
+    # the weekly Slack fetch cache. Identical inputs (same messages,
+    # date range and sender) skip the API call entirely.
+    CACHE_DIR = Path.home() / ".cache" / "report-generator" / "groq"
+
+    # One OpenAI client per API key, shared across enhancer instances so
+    # sequential calls (enhance + summarize) reuse the same pooled
+    # keepalive connection instead of paying a TLS handshake each time.
+    _client_cache: dict = {}
+
     def __init__(self, api_key: str):
         """Initialize with Groq API key."""
         try:
             from openai import OpenAI
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url=self.GROQ_BASE_URL,
-            )
-            self.available = True
         except ImportError:
             self.available = False
             print("OpenAI package not installed. Groq AI enhancement disabled.")
+            return
+
+        client = self._client_cache.get(api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                base_url=self.GROQ_BASE_URL,
+            )
+            self._client_cache[api_key] = client
+        self.client = client
+        self.available = True
+
+    def _cache_path(self, prompt: str) -> Path:
+        """Cache file path for a prompt (content-addressed by hash)."""
+        key = hashlib.sha256(f"{self.GROQ_MODEL}\n{prompt}".encode()).hexdigest()
+        return self.CACHE_DIR / f"{key}.txt"
+
+    @staticmethod
+    def _load_cached(cache_path: Path) -> Optional[str]:
+        """Return a cached response, or None if absent/unreadable."""
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
 
-    def enhance_report(self, raw_messages: list[str], date_range: str, sender_name: str = "") -> str:
+    @staticmethod
+    def _store_cached(cache_path: Path, text: str):
+        """Atomically write a response to the cache (best-effort)."""
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    @classmethod
+    def clear_cache(cls):
+        """Delete all cached Groq responses."""
+        if cls.CACHE_DIR.is_dir():
+            for path in cls.CACHE_DIR.iterdir():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def enhance_report(
+        self,
+        raw_messages: Iterable[str],
+        date_range: str,
+        sender_name: str = "",
+        use_cache: bool = True,
+    ) -> str:
         """
         Use Groq AI to generate an enhanced report from raw messages.
-        
+
         Args:
-            raw_messages: List of raw status update messages
+            raw_messages: Raw status update messages (any iterable; consumed once)
             date_range: Date range string (e.g., "January 19th to January 23rd, 2026")
             sender_name: Name of the report sender
-            
+            use_cache: Serve/store the response from the on-disk cache
+
         Returns:
             AI-enhanced report
         """
@@ -469,8 +541,19 @@ Thanks and Best regards,
 
 Generate the report now. Include items from ALL team members listed above; use each person's name (e.g. @Binh Huynh, @Rogerio Batista) for their items."""
 
+        cache_path = None
+        if use_cache:
+            cache_path = self._cache_path(prompt)
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
+
         try:
-            response = self.client.chat.completions.create(
+            # Stream the completion: chunks are consumed as they are
+            # generated instead of blocking until all 4000 tokens are
+            # buffered server-side, and a mid-generation failure
+            # surfaces immediately rather than after the full wait
+            stream = self.client.chat.completions.create(
                 model=self.GROQ_MODEL,
                 messages=[
                     {"role": "system", "content": "You are a professional technical writer. Create clear, well-organized status reports. Follow the output format exactly."},
@@ -478,8 +561,17 @@ Generate the report now. Include items from ALL team members listed above; use e
                 ],
                 temperature=0.2,
                 max_tokens=4000,
+                stream=True,
             )
-            return response.choices[0].message.content
+            parts = []
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+            text = "".join(parts)
+            if text and cache_path is not None:
+                self._store_cached(cache_path, text)
+            return text or None
         except Exception as e:
             print(f"Groq AI enhancement failed: {e}")
             return None
@@ -2,17 +2,147 @@
 Slack client for reading channel messages and user information.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import os
+import pickle
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from slack_sdk.web.async_client import AsyncWebClient
 
 from .config import SlackConfig
 
+try:
+    import orjson
+    from slack_sdk.web import base_client as _slack_base_client
 
-@dataclass
+    class _OrjsonShim:
+        """stdlib-json stand-in that routes loads through orjson's C parser.
+
+        slack_sdk parses every API response with its module-level ``json``;
+        swapping in orjson speeds up the large history/replies payloads.
+        orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+        SDK's error handling is unaffected; everything else (dumps,
+        decoder, ...) still resolves to the stdlib module.
+        """
+
+        loads = staticmethod(orjson.loads)
+
+        def __getattr__(self, name):
+            return getattr(json, name)
+
+    _slack_base_client.json = _OrjsonShim()
+except ImportError:
+    pass  # orjson not installed; slack_sdk keeps using stdlib json
+
+# On-disk cache for weekly Slack fetches. Past weeks never change, so
+# they are cached indefinitely; the current week gets a short TTL.
+CACHE_DIR = Path.home() / ".cache" / "report-generator"
+CACHE_TTL_SECONDS = 600
+
+# User directory cache: names change rarely, so a week-old snapshot is
+# fine and saves the users.list warm-up on every cold start.
+USER_CACHE_FILE = CACHE_DIR / "users.pkl"
+USER_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_MONTHS = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?"
+    r"|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
+)
+
+# Date formats seen in daily report headers, compiled once at import.
+# Each pattern carries the strptime formats that can parse its matches,
+# so the regex that hit decides the parse directly.
+_DATE_PATTERNS = (
+    # "Jan 19, 2026" or "January 19, 2026"
+    (
+        re.compile(_MONTHS + r"\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}", re.IGNORECASE),
+        ("%b %d, %Y", "%B %d, %Y", "%b %d %Y", "%B %d %Y"),
+    ),
+    # "19 Jan 2026"
+    (
+        re.compile(r"\d{1,2}\s+" + _MONTHS + r"\s+\d{4}", re.IGNORECASE),
+        ("%d %b %Y", "%d %B %Y"),
+    ),
+    # "2026-01-19"
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), ("%Y-%m-%d",)),
+    # "01/19/2026"
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%m/%d/%Y",)),
+)
+
+# Ordinal suffixes stripped before date parsing ("19th" -> "19")
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)")
+
+# Pattern matching "Daily report" / status header messages
+_DAILY_REPORT_RE = re.compile(
+    r"daily\s*report|daily\s*update|status\s*update|standup|stand-up|weekly\s*report",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_date_from_text(text: str) -> Optional[datetime]:
+    """Extract a date from header text, memoized on the exact text.
+
+    Headers repeat verbatim across the week/fallback scans and reruns,
+    and even a strptime parse dwarfs a cache lookup.
+    """
+    for pattern, formats in _DATE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            date_str = match.group(0)
+            # Remove ordinal suffixes (st, nd, rd, th)
+            date_str = _ORDINAL_RE.sub(r'\1', date_str)
+            for fmt in formats:
+                try:
+                    return datetime.strptime(date_str, fmt)
+                except ValueError:
+                    pass
+
+    return None
+
+
+@lru_cache(maxsize=64)
+def _iso_week_start(year: int, week_number: int) -> datetime:
+    """Monday 00:00 of the given ISO week (week 1 contains January 4th)."""
+    jan4 = date(year, 1, 4)
+    week1_monday = jan4 - timedelta(days=jan4.weekday())
+    return datetime.combine(
+        week1_monday + timedelta(weeks=week_number - 1),
+        datetime.min.time(),
+    )
+
+
+def _is_daily_report_header(text: str) -> bool:
+    """True when text looks like a daily-report header message.
+
+    Every regex branch needs one of these substrings, so the C-level
+    ``in`` checks reject the typical non-header message without ever
+    entering the regex engine.
+    """
+    low = text.lower()
+    if (
+        "daily" not in low
+        and "status" not in low
+        and "stand" not in low
+        and "weekly" not in low
+    ):
+        return False
+    return _DAILY_REPORT_RE.search(text) is not None
+
+
+@dataclass(slots=True)
 class SlackMessage:
     """Represents a Slack message."""
     user_id: str
@@ -21,14 +151,11 @@ class SlackMessage:
     timestamp: datetime
     thread_ts: Optional[str] = None
     ts: Optional[str] = None  # Slack message timestamp ID (for API calls)
-    reactions: list[dict] = None
+    # (name, count) pairs; a flat tuple instead of Slack's raw dicts
+    reactions: tuple[tuple[str, int], ...] = ()
 
-    def __post_init__(self):
-        if self.reactions is None:
-            self.reactions = []
 
-
-@dataclass
+@dataclass(slots=True)
 class SlackUser:
     """Represents a Slack user."""
     id: str
@@ -40,36 +167,181 @@ class SlackUser:
 class SlackClient:
     """Client for interacting with Slack API."""
 
+    # Upper bound on thread-reply fetches running in parallel (async path);
+    # keeps us well inside Slack's Tier 3 rate limits.
+    MAX_CONCURRENT_THREAD_FETCHES = 8
+
+    # Entries kept in the per-client history range cache (~ a few weeks)
+    HISTORY_CACHE_SIZE = 32
+
     def __init__(self, config: SlackConfig):
         """Initialize the Slack client."""
         self.config = config
-        self.client = WebClient(token=config.bot_token)
-        self._user_cache: dict[str, SlackUser] = {}
+        self.client = WebClient(token=config.bot_token, timeout=30)
+        self.async_client = AsyncWebClient(token=config.bot_token, timeout=30)
+        # Honor 429 Retry-After instead of failing mid-fetch; the thread
+        # fan-out can brush against Slack's Tier 3 limits
+        self.client.retry_handlers.append(
+            RateLimitErrorRetryHandler(max_retry_count=3)
+        )
+        self.async_client.retry_handlers.append(
+            AsyncRateLimitErrorRetryHandler(max_retry_count=3)
+        )
+        # In-memory LRU of history fetches by (oldest, latest, limit);
+        # the week/fallback searches often cover overlapping ranges
+        self._history_cache: dict[tuple, list[SlackMessage]] = {}
+        self._user_cache: dict[str, SlackUser] = self._load_user_cache()
+        self._user_cache_dirty = False
+        # A fresh on-disk snapshot stands in for the users.list warm-up
+        self._users_warmed = bool(self._user_cache)
+
+    @staticmethod
+    def _load_user_cache() -> dict[str, SlackUser]:
+        """Load the persisted user cache if it is under a week old."""
+        try:
+            if time.time() - USER_CACHE_FILE.stat().st_mtime > USER_CACHE_TTL_SECONDS:
+                return {}  # stale snapshot; refetch to pick up name changes
+            with open(USER_CACHE_FILE, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return {}  # missing/corrupt cache; start cold
+
+    def _flush_user_cache(self):
+        """Atomically persist the user cache if it gained entries."""
+        if not self._user_cache_dirty:
+            return
+        self._user_cache_dirty = False
+        tmp_path = USER_CACHE_FILE.with_suffix(".tmp")
+        try:
+            USER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self._user_cache, f)
+            os.replace(tmp_path, USER_CACHE_FILE)
+        except Exception:
+            pass
+
+    def _warm_user_cache(self):
+        """Bulk-fill the user cache with one paginated users.list call.
+
+        One list call per ~999 members replaces a users.info round-trip
+        per distinct author; attempted once, then lookups fall back to
+        per-user fetches for anything it missed.
+        """
+        if self._users_warmed:
+            return
+        self._users_warmed = True
+        try:
+            cursor = None
+            while True:
+                response = self.client.users_list(limit=999, cursor=cursor)
+                for member in response.get("members", []):
+                    member_id = member.get("id")
+                    if member_id and member_id not in self._user_cache:
+                        self._user_cache[member_id] = self._user_from_data(
+                            member_id, member
+                        )
+                        self._user_cache_dirty = True
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+        except SlackApiError as e:
+            print(f"Error warming user cache: {e}")
+
+    async def _warm_user_cache_async(self):
+        """Async variant of _warm_user_cache, sharing the same flag."""
+        if self._users_warmed:
+            return
+        self._users_warmed = True
+        try:
+            cursor = None
+            while True:
+                response = await self.async_client.users_list(limit=999, cursor=cursor)
+                for member in response.get("members", []):
+                    member_id = member.get("id")
+                    if member_id and member_id not in self._user_cache:
+                        self._user_cache[member_id] = self._user_from_data(
+                            member_id, member
+                        )
+                        self._user_cache_dirty = True
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+        except SlackApiError as e:
+            print(f"Error warming user cache: {e}")
+
+    @staticmethod
+    def _user_from_data(user_id: str, user_data: dict) -> SlackUser:
+        """Build a SlackUser from a users.info response payload."""
+        return SlackUser(
+            id=user_id,
+            name=user_data.get("name", "unknown"),
+            real_name=user_data.get("real_name", "Unknown User"),
+            display_name=user_data.get("profile", {}).get("display_name", ""),
+        )
+
+    @staticmethod
+    def _unknown_user(user_id: str) -> SlackUser:
+        """Fallback user for failed lookups."""
+        return SlackUser(
+            id=user_id,
+            name="unknown",
+            real_name="Unknown User",
+            display_name="",
+        )
+
+    def _to_message(self, msg: dict, user: SlackUser) -> SlackMessage:
+        """Convert a raw Slack message payload into a SlackMessage."""
+        ts = float(msg.get("ts", 0))
+        return SlackMessage(
+            user_id=msg.get("user", ""),
+            user_name=user.real_name or user.display_name or user.name,
+            text=msg.get("text", ""),
+            timestamp=datetime.fromtimestamp(ts),
+            thread_ts=msg.get("thread_ts"),
+            ts=msg.get("ts", ""),
+            reactions=tuple(
+                (r.get("name", ""), r.get("count", 0))
+                for r in msg.get("reactions", ())
+            ),
+        )
 
     def get_user(self, user_id: str) -> SlackUser:
         """Get user information by ID, with caching."""
         if user_id in self._user_cache:
             return self._user_cache[user_id]
 
+        self._warm_user_cache()
+        if user_id in self._user_cache:
+            return self._user_cache[user_id]
+
         try:
             response = self.client.users_info(user=user_id)
-            user_data = response["user"]
-            user = SlackUser(
-                id=user_id,
-                name=user_data.get("name", "unknown"),
-                real_name=user_data.get("real_name", "Unknown User"),
-                display_name=user_data.get("profile", {}).get("display_name", ""),
-            )
+            user = self._user_from_data(user_id, response["user"])
             self._user_cache[user_id] = user
+            self._user_cache_dirty = True
             return user
         except SlackApiError as e:
             print(f"Error fetching user {user_id}: {e}")
-            return SlackUser(
-                id=user_id,
-                name="unknown",
-                real_name="Unknown User",
-                display_name="",
-            )
+            return self._unknown_user(user_id)
+
+    async def get_user_async(self, user_id: str) -> SlackUser:
+        """Async variant of get_user, sharing the same cache."""
+        if user_id in self._user_cache:
+            return self._user_cache[user_id]
+
+        await self._warm_user_cache_async()
+        if user_id in self._user_cache:
+            return self._user_cache[user_id]
+
+        try:
+            response = await self.async_client.users_info(user=user_id)
+            user = self._user_from_data(user_id, response["user"])
+            self._user_cache[user_id] = user
+            self._user_cache_dirty = True
+            return user
+        except SlackApiError as e:
+            print(f"Error fetching user {user_id}: {e}")
+            return self._unknown_user(user_id)
 
     def get_channel_messages(
         self,
@@ -88,12 +360,20 @@ class SlackClient:
         Returns:
             List of SlackMessage objects sorted by timestamp
         """
-        messages = []
-        
         # Convert dates to Unix timestamps
         oldest = start_date.timestamp()
         latest = end_date.timestamp()
 
+        cached = self._history_cache_get(oldest, latest, limit)
+        if cached is not None:
+            return cached
+
+        # Pages arrive newest-first, and so do the messages inside each
+        # page; reversing both at the end yields chronological order
+        # without a sort.
+        pages: list[list[SlackMessage]] = []
+        fetched = 0
+
         try:
             cursor = None
             while True:
@@ -101,40 +381,32 @@ class SlackClient:
                     channel=self.config.channel_id,
                     oldest=str(oldest),
                     latest=str(latest),
-                    limit=min(limit - len(messages), 200),
+                    # Slack allows up to 1000 messages per page; bigger pages mean
+                    # ~5x fewer cursor round-trips for a full fetch
+                    limit=min(limit - fetched, 999),
                     cursor=cursor,
                 )
 
+                page = []
                 for msg in response.get("messages", []):
                     # Skip bot messages and system messages
                     if msg.get("subtype") in ["bot_message", "channel_join", "channel_leave"]:
                         continue
-                    
+
                     user_id = msg.get("user", "")
                     if not user_id:
                         continue
 
                     user = self.get_user(user_id)
-                    
-                    # Parse timestamp
-                    ts = float(msg.get("ts", 0))
-                    timestamp = datetime.fromtimestamp(ts)
-
-                    msg_ts = msg.get("ts", "")
-                    messages.append(SlackMessage(
-                        user_id=user_id,
-                        user_name=user.real_name or user.display_name or user.name,
-                        text=msg.get("text", ""),
-                        timestamp=timestamp,
-                        thread_ts=msg.get("thread_ts"),
-                        ts=msg_ts,
-                        reactions=msg.get("reactions", []),
-                    ))
+                    page.append(self._to_message(msg, user))
+
+                pages.append(page)
+                fetched += len(page)
 
                 # Check for pagination
-                if not response.get("has_more") or len(messages) >= limit:
+                if not response.get("has_more") or fetched >= limit:
                     break
-                    
+
                 cursor = response.get("response_metadata", {}).get("next_cursor")
                 if not cursor:
                     break
@@ -143,10 +415,23 @@ class SlackClient:
             print(f"Error fetching messages: {e}")
             raise
 
-        # Sort messages by timestamp (oldest first)
-        messages.sort(key=lambda m: m.timestamp)
+        # Oldest first: last page first, each page back-to-front
+        messages = [m for page in reversed(pages) for m in reversed(page)]
+        self._history_cache_put(oldest, latest, limit, messages)
+        self._flush_user_cache()
         return messages
 
+    def _history_cache_get(self, oldest: float, latest: float, limit: int):
+        """Return a cached history fetch for this exact range, if any."""
+        cached = self._history_cache.get((oldest, latest, limit))
+        return list(cached) if cached is not None else None
+
+    def _history_cache_put(self, oldest: float, latest: float, limit: int, messages):
+        """Cache a history fetch, evicting the oldest entry past the cap."""
+        self._history_cache[(oldest, latest, limit)] = messages
+        while len(self._history_cache) > self.HISTORY_CACHE_SIZE:
+            del self._history_cache[next(iter(self._history_cache))]
+
     def get_thread_messages(self, thread_ts: str) -> list[SlackMessage]:
         """Fetch all messages in a thread."""
         messages = []
@@ -163,19 +448,92 @@ class SlackClient:
                     continue
 
                 user = self.get_user(user_id)
-                ts = float(msg.get("ts", 0))
-                timestamp = datetime.fromtimestamp(ts)
-
-                msg_ts = msg.get("ts", "")
-                messages.append(SlackMessage(
-                    user_id=user_id,
-                    user_name=user.real_name or user.display_name or user.name,
-                    text=msg.get("text", ""),
-                    timestamp=timestamp,
-                    thread_ts=msg.get("thread_ts"),
-                    ts=msg_ts,
-                    reactions=msg.get("reactions", []),
-                ))
+                messages.append(self._to_message(msg, user))
+
+        except SlackApiError as e:
+            print(f"Error fetching thread: {e}")
+
+        return messages
+
+    async def get_channel_messages_async(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int = 1000,
+    ) -> list[SlackMessage]:
+        """Async variant of get_channel_messages."""
+        oldest = start_date.timestamp()
+        latest = end_date.timestamp()
+
+        cached = self._history_cache_get(oldest, latest, limit)
+        if cached is not None:
+            return cached
+
+        pages: list[list[SlackMessage]] = []
+        fetched = 0
+
+        try:
+            cursor = None
+            while True:
+                response = await self.async_client.conversations_history(
+                    channel=self.config.channel_id,
+                    oldest=str(oldest),
+                    latest=str(latest),
+                    # Slack allows up to 1000 messages per page; bigger pages mean
+                    # ~5x fewer cursor round-trips for a full fetch
+                    limit=min(limit - fetched, 999),
+                    cursor=cursor,
+                )
+
+                page = []
+                for msg in response.get("messages", []):
+                    if msg.get("subtype") in ["bot_message", "channel_join", "channel_leave"]:
+                        continue
+
+                    user_id = msg.get("user", "")
+                    if not user_id:
+                        continue
+
+                    user = await self.get_user_async(user_id)
+                    page.append(self._to_message(msg, user))
+
+                pages.append(page)
+                fetched += len(page)
+
+                if not response.get("has_more") or fetched >= limit:
+                    break
+
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+
+        except SlackApiError as e:
+            print(f"Error fetching messages: {e}")
+            raise
+
+        # Oldest first: last page first, each page back-to-front
+        messages = [m for page in reversed(pages) for m in reversed(page)]
+        self._history_cache_put(oldest, latest, limit, messages)
+        self._flush_user_cache()
+        return messages
+
+    async def get_thread_messages_async(self, thread_ts: str) -> list[SlackMessage]:
+        """Async variant of get_thread_messages."""
+        messages = []
+
+        try:
+            response = await self.async_client.conversations_replies(
+                channel=self.config.channel_id,
+                ts=thread_ts,
+            )
+
+            for msg in response.get("messages", []):
+                user_id = msg.get("user", "")
+                if not user_id:
+                    continue
+
+                user = await self.get_user_async(user_id)
+                messages.append(self._to_message(msg, user))
 
         except SlackApiError as e:
             print(f"Error fetching thread: {e}")
@@ -207,19 +565,7 @@ class SlackClient:
         Returns:
             List of messages from that week
         """
-        # Get the Monday of the ISO week using ISO calendar
-        # ISO week 1 is the week containing January 4th
-        from datetime import date
-        
-        # Find January 4th of the year (always in week 1)
-        jan4 = date(year, 1, 4)
-        # Find the Monday of week 1
-        week1_monday = jan4 - timedelta(days=jan4.weekday())
-        # Calculate the Monday of the requested week
-        first_day = datetime.combine(
-            week1_monday + timedelta(weeks=week_number - 1),
-            datetime.min.time()
-        )
+        first_day = _iso_week_start(year, week_number)
         last_day = first_day + timedelta(days=4)  # Friday
         last_day = last_day.replace(hour=23, minute=59, second=59, microsecond=999999)
 
@@ -228,7 +574,7 @@ class SlackClient:
     def _parse_date_from_text(self, text: str) -> Optional[datetime]:
         """
         Extract a date from message text like "Daily report - Jan 19, 2026".
-        
+
         Supports formats:
         - "Jan 19, 2026"
         - "January 19, 2026"
@@ -236,33 +582,7 @@ class SlackClient:
         - "19 Jan 2026"
         - "2026-01-19"
         """
-        import re
-        from dateutil import parser as date_parser
-        
-        # Common date patterns in daily report headers
-        date_patterns = [
-            # "Jan 19, 2026" or "January 19, 2026"
-            r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}',
-            # "19 Jan 2026"
-            r'\d{1,2}\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}',
-            # "2026-01-19"
-            r'\d{4}-\d{2}-\d{2}',
-            # "01/19/2026"
-            r'\d{1,2}/\d{1,2}/\d{4}',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(0)
-                # Remove ordinal suffixes (st, nd, rd, th)
-                date_str = re.sub(r'(\d+)(?:st|nd|rd|th)', r'\1', date_str)
-                try:
-                    return date_parser.parse(date_str)
-                except (ValueError, TypeError):
-                    continue
-        
-        return None
+        return _parse_date_from_text(text)
 
     def find_daily_report_threads(
         self,
@@ -282,43 +602,89 @@ class SlackClient:
         Returns:
             List of dicts with 'header' (main message) and 'replies' (thread messages)
         """
-        import re
-        
-        # Pattern to match "Daily report" / status header messages
-        daily_report_pattern = re.compile(
-            r"daily\s*report|daily\s*update|status\s*update|standup|stand-up|weekly\s*report",
-            re.IGNORECASE
-        )
-        
         # Get all messages in the date range
         messages = self.get_channel_messages(start_date, end_date)
-        
+
+        # Identify header messages, then fetch their thread replies in
+        # parallel — each reply fetch is an independent ~300ms round-trip.
+        headers = [msg for msg in messages if _is_daily_report_header(msg.text)]
+        thread_ts_list = [
+            # Use message ts for thread (top-level message ts = thread_ts)
+            msg.ts or msg.thread_ts or str(msg.timestamp.timestamp())
+            for msg in headers
+        ]
+
+        if not headers:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENT_THREAD_FETCHES, len(headers))
+        ) as executor:
+            thread_lists = list(executor.map(self.get_thread_messages, thread_ts_list))
+
         daily_reports = []
-        
-        for msg in messages:
-            # Check if this is a daily report header message
-            if daily_report_pattern.search(msg.text):
-                # Use message ts for thread (top-level message ts = thread_ts)
-                thread_ts = msg.ts or msg.thread_ts or str(msg.timestamp.timestamp())
-                
-                # Fetch all thread replies
-                thread_messages = self.get_thread_messages(thread_ts)
-                
-                # Exclude header: same ts as thread parent
-                replies = [m for m in thread_messages if (m.ts or "") != thread_ts]
-                
-                # Try to parse the report date from the message content
-                report_date = self._parse_date_from_text(msg.text)
-                if report_date is None:
-                    report_date = msg.timestamp
-                
-                daily_reports.append({
-                    'header': msg,
-                    'replies': replies,
-                    'date': report_date,
-                    'thread_ts': thread_ts,
-                })
-        
+        for msg, thread_ts, thread_messages in zip(headers, thread_ts_list, thread_lists):
+            # Exclude header: same ts as thread parent
+            replies = [m for m in thread_messages if (m.ts or "") != thread_ts]
+
+            # Try to parse the report date from the message content
+            report_date = self._parse_date_from_text(msg.text)
+            if report_date is None:
+                report_date = msg.timestamp
+
+            daily_reports.append({
+                'header': msg,
+                'replies': replies,
+                'date': report_date,
+                'thread_ts': thread_ts,
+            })
+
+        return daily_reports
+
+    async def find_daily_report_threads_async(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[dict]:
+        """
+        Async variant of find_daily_report_threads.
+
+        Thread replies are fetched in parallel (bounded by a semaphore)
+        instead of one serial round-trip per daily report.
+        """
+        messages = await self.get_channel_messages_async(start_date, end_date)
+
+        headers = [msg for msg in messages if _is_daily_report_header(msg.text)]
+        thread_ts_list = [
+            msg.ts or msg.thread_ts or str(msg.timestamp.timestamp())
+            for msg in headers
+        ]
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_THREAD_FETCHES)
+
+        async def fetch_thread(thread_ts: str) -> list[SlackMessage]:
+            async with semaphore:
+                return await self.get_thread_messages_async(thread_ts)
+
+        thread_lists = await asyncio.gather(
+            *(fetch_thread(ts) for ts in thread_ts_list)
+        )
+
+        daily_reports = []
+        for msg, thread_ts, thread_messages in zip(headers, thread_ts_list, thread_lists):
+            replies = [m for m in thread_messages if (m.ts or "") != thread_ts]
+
+            report_date = self._parse_date_from_text(msg.text)
+            if report_date is None:
+                report_date = msg.timestamp
+
+            daily_reports.append({
+                'header': msg,
+                'replies': replies,
+                'date': report_date,
+                'thread_ts': thread_ts,
+            })
+
         return daily_reports
 
     def get_threads_by_ts(
@@ -348,38 +714,106 @@ class SlackClient:
         all_replies.sort(key=lambda m: m.timestamp)
         return all_replies, thread_infos
 
+    async def get_threads_by_ts_async(
+        self, thread_ts_list: list[str]
+    ) -> tuple[list[SlackMessage], list[dict]]:
+        """Async variant of get_threads_by_ts with parallel thread fetches."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_THREAD_FETCHES)
+
+        async def fetch_thread(thread_ts: str) -> list[SlackMessage]:
+            async with semaphore:
+                return await self.get_thread_messages_async(thread_ts)
+
+        thread_lists = await asyncio.gather(
+            *(fetch_thread(ts) for ts in thread_ts_list)
+        )
+
+        all_replies = []
+        thread_infos = []
+        for thread_ts, thread_messages in zip(thread_ts_list, thread_lists):
+            if not thread_messages:
+                continue
+            # First message is the parent; rest are replies
+            parent_ts = thread_messages[0].ts or thread_ts
+            replies = [m for m in thread_messages if (m.ts or "") != parent_ts]
+            all_replies.extend(replies)
+            header = thread_messages[0]
+            report_date = self._parse_date_from_text(header.text) or header.timestamp
+            thread_infos.append({
+                'thread_ts': thread_ts,
+                'date': report_date,
+                'reply_count': len(replies),
+            })
+        all_replies.sort(key=lambda m: m.timestamp)
+        return all_replies, thread_infos
+
+    def _week_cache_path(self, year: int, week_number: int) -> Path:
+        """Cache file path for a (channel, year, week) fetch."""
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        return CACHE_DIR / f"{self.config.channel_id}_{year}_W{week_number:02d}.pkl"
+
+    @staticmethod
+    def _load_week_cache(cache_path: Path, year: int, week_number: int):
+        """Load a cached weekly fetch if it is still fresh, else None."""
+        if not cache_path.exists():
+            return None
+
+        iso = datetime.now().isocalendar()
+        is_past_week = (year, week_number) < (iso[0], iso[1])
+        if not is_past_week and time.time() - cache_path.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None  # corrupt/stale cache; refetch
+
+    @staticmethod
+    def _store_week_cache(cache_path: Path, result):
+        """Atomically write a weekly fetch result to the cache (best-effort)."""
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
     def get_weekly_status_updates(
         self,
         year: int = None,
         week_number: int = None,
         fallback_days: int = None,
+        use_cache: bool = True,
     ) -> tuple[list[SlackMessage], list[dict], dict]:
         """
         Get all status updates from daily report threads for a specific week.
-        
+
         Args:
             year: The year (default: current year)
             week_number: ISO week number (default: current week)
             fallback_days: If no threads found for the week, search this many days back (default: 7)
-            
+            use_cache: Serve/store results from the on-disk weekly cache
+
         Returns:
             Tuple of (all status update messages, daily report threads, diagnostics dict)
         """
-        from datetime import date
-        
         now = datetime.now()
         if year is None:
             year = now.year
         if week_number is None:
             week_number = now.isocalendar()[1]
-        
+
+        cache_path = None
+        if use_cache:
+            cache_path = self._week_cache_path(year, week_number)
+            cached = self._load_week_cache(cache_path, year, week_number)
+            if cached is not None:
+                return cached
+
         # Calculate week date range using ISO week
-        jan4 = date(year, 1, 4)
-        week1_monday = jan4 - timedelta(days=jan4.weekday())
-        first_day = datetime.combine(
-            week1_monday + timedelta(weeks=week_number - 1),
-            datetime.min.time()
-        )
+        first_day = _iso_week_start(year, week_number)
         last_day = first_day + timedelta(days=6)
         last_day = last_day.replace(hour=23, minute=59, second=59, microsecond=999999)
         
@@ -392,8 +826,10 @@ class SlackClient:
         }
         
         daily_reports = self.find_daily_report_threads(first_day, last_day)
-        
-        # If no threads found and fallback requested, try last N days
+
+        # Only scan the fallback window when the week came up empty — the
+        # common case already has data, and the extra scan would double
+        # the conversations.history/replies traffic for nothing.
         if not daily_reports and fallback_days:
             fallback_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
             fallback_start = fallback_end - timedelta(days=fallback_days)
@@ -412,5 +848,62 @@ class SlackClient:
         all_updates.sort(key=lambda m: m.timestamp)
         diagnostics["threads_found"] = len(daily_reports)
         diagnostics["replies_found"] = len(all_updates)
-        
+
+        result = (all_updates, daily_reports, diagnostics)
+
+        # Don't cache fallback results under the week key — they describe a
+        # different (relative) window and would go stale for past weeks.
+        if cache_path is not None and not diagnostics["used_fallback"]:
+            self._store_week_cache(cache_path, result)
+
+        return result
+
+    async def get_weekly_status_updates_async(
+        self,
+        year: int = None,
+        week_number: int = None,
+        fallback_days: int = None,
+    ) -> tuple[list[SlackMessage], list[dict], dict]:
+        """Async variant of get_weekly_status_updates."""
+        now = datetime.now()
+        if year is None:
+            year = now.year
+        if week_number is None:
+            week_number = now.isocalendar()[1]
+
+        # Calculate week date range using ISO week
+        first_day = _iso_week_start(year, week_number)
+        last_day = first_day + timedelta(days=6)
+        last_day = last_day.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        diagnostics = {
+            "year": year,
+            "week": week_number,
+            "start": first_day,
+            "end": last_day,
+            "used_fallback": False,
+        }
+
+        daily_reports = await self.find_daily_report_threads_async(first_day, last_day)
+
+        # If no threads found and fallback requested, try last N days
+        if not daily_reports and fallback_days:
+            fallback_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+            fallback_start = fallback_end - timedelta(days=fallback_days)
+            fallback_start = fallback_start.replace(hour=0, minute=0, second=0, microsecond=0)
+            daily_reports = await self.find_daily_report_threads_async(fallback_start, fallback_end)
+            if daily_reports:
+                diagnostics["used_fallback"] = True
+                diagnostics["start"] = fallback_start
+                diagnostics["end"] = fallback_end
+                diagnostics["fallback_days"] = fallback_days
+
+        all_updates = []
+        for report in daily_reports:
+            all_updates.extend(report['replies'])
+
+        all_updates.sort(key=lambda m: m.timestamp)
+        diagnostics["threads_found"] = len(daily_reports)
+        diagnostics["replies_found"] = len(all_updates)
+
         return all_updates, daily_reports, diagnostics
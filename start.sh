@@ -38,7 +38,7 @@ echo ""
 
 # Start backend in background
 source venv/bin/activate
-python -m uvicorn api.main:app --reload --port 8000 &
+python -m uvicorn api.main:app --reload --port 8000 --loop uvloop --http httptools &
 BACKEND_PID=$!
 
 # Start frontend in background
@@ -67,7 +67,7 @@ export default function EmailSender({ config, selectedReport }) {
 
   const fetchReportContent = async (filename) => {
     try {
-      const response = await axios.get(`/api/reports/${filename}`)
+      const response = await axios.get(`/api/reports/${filename}?raw=1`)
       setReportContent(response.data.content)
     } catch (error) {
       console.error('Failed to fetch report:', error)
@@ -57,7 +57,7 @@ export default function ReportViewer({ selectedReport, onSendEmail }) {
 
   const handleView = async (filename) => {
     try {
-      const response = await axios.get(`/api/reports/${filename}`)
+      const response = await axios.get(`/api/reports/${filename}?raw=1`)
       setViewReport(filename)
       setReportContent(response.data.content)
     } catch (error) {